@@ -1,43 +1,43 @@
 """
 Core business logic for paper2slides
+
+Names are resolved from their submodules on first access, so importing one
+light piece (e.g. STAGES) does not pull in the whole pipeline and its stages.
 """
-from .paths import (
-    get_base_dir,
-    get_config_name,
-    get_config_dir,
-    get_rag_checkpoint,
-    get_summary_checkpoint,
-    get_summary_md,
-    get_plan_checkpoint,
-    get_output_dir,
-)
-from .state import (
-    STAGES,
-    load_state,
-    save_state,
-    create_state,
-    detect_start_stage,
-)
-from .pipeline import run_pipeline, list_outputs
+import importlib
 
-__all__ = [
+_EXPORTS = {
     # Path functions
-    "get_base_dir",
-    "get_config_name",
-    "get_config_dir",
-    "get_rag_checkpoint",
-    "get_summary_checkpoint",
-    "get_summary_md",
-    "get_plan_checkpoint",
-    "get_output_dir",
+    "get_base_dir": ".paths",
+    "get_config_name": ".paths",
+    "get_config_dir": ".paths",
+    "get_rag_checkpoint": ".paths",
+    "get_summary_checkpoint": ".paths",
+    "get_summary_md": ".paths",
+    "get_plan_checkpoint": ".paths",
+    "get_output_dir": ".paths",
     # State management
-    "STAGES",
-    "load_state",
-    "save_state",
-    "create_state",
-    "detect_start_stage",
+    "STAGES": ".state",
+    "load_state": ".state",
+    "save_state": ".state",
+    "create_state": ".state",
+    "detect_start_stage": ".state",
     # Pipeline
-    "run_pipeline",
-    "list_outputs",
-]
+    "run_pipeline": ".pipeline",
+    "list_outputs": ".pipeline",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value  # later lookups skip __getattr__
+    return value
+
 
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -3,18 +3,178 @@ Agent Integration for Paper2Slides
 
 Provides LLM-based style transformation for speaker notes.
 """
+import contextlib
+import contextvars
+import functools
+import hashlib
+import json
 import logging
 import os
+import re
+import sys
+import time
 from pathlib import Path
-from openai import OpenAI
+from typing import Any, AsyncIterator, Callable, Dict, Final, Iterator, List, Optional
+from openai import AsyncOpenAI, OpenAI, RateLimitError
+
+from paper2slides.core import semantic_cache
+from paper2slides.utils.rate_limit import RateLimiter, retry
 
 logger = logging.getLogger(__name__)
 
+# Narrative model (override with RAG_LLM_MODEL, e.g. RAG_LLM_MODEL=gpt-4o)
+DEFAULT_NARRATIVE_MODEL = "gpt-4o-mini"
+# Upper bound on completion length per narrative
+DEFAULT_MAX_TOKENS = 2000
+# Upper bound on one multi-slide completion (gpt-4o-mini caps output at 16k)
+MULTI_SLIDE_MAX_TOKENS = 16000
+
+# Structured output for multi-slide requests: one narrative per slide id
+_NARRATIVES_SCHEMA: Final[Dict[str, Any]] = {
+    "type": "object",
+    "properties": {
+        "narratives": {
+            "type": "array",
+            "items": {
+                "type": "object",
+                "properties": {
+                    "id": {"type": "string"},
+                    "narrative": {"type": "string"},
+                },
+                "required": ["id", "narrative"],
+                "additionalProperties": False,
+            },
+        },
+    },
+    "required": ["narratives"],
+    "additionalProperties": False,
+}
+
+# Used when a style profile has no prompt file. Kept as one interned module
+# constant so every request sends a byte-identical system prefix.
+_GENERIC_SYSTEM_PROMPT: Final[str] = sys.intern("""You are transforming structured speaker notes into a natural, conversational narrative script.
+
+Make it sound like someone actually speaking to an audience, not reading bullet points.
+Keep the content accurate but make the delivery engaging and natural.""")
+
+# On-disk response cache (enabled with RAG_LLM_CACHE=1)
+_cache_dir = Path.home() / ".cache" / "paper2slides" / "llm"
+DEFAULT_CACHE_TTL = 7 * 24 * 3600  # seconds, override with RAG_LLM_CACHE_TTL
+
+# Batch API: only worth the turnaround for large decks
+BATCH_MIN_REQUESTS = 50
+BATCH_POLL_INITIAL_DELAY = 10.0  # seconds
+BATCH_POLL_MAX_DELAY = 300.0  # seconds
+
+# Retry policy for 429 responses that slip past the rate limiter
+RATE_LIMIT_MAX_RETRIES = 5
+RATE_LIMIT_BASE_DELAY = 1.0  # seconds
+
+# Sentence boundary in streamed output: terminal punctuation, then whitespace
+_SENTENCE_END = re.compile(r"(?<=[.!?])(\s+)")
+
+
+def get_llm_model() -> str:
+    """Return the model used for narrative transformation."""
+    return os.getenv("RAG_LLM_MODEL", DEFAULT_NARRATIVE_MODEL)
+
+
+def _env_float(name: str) -> Optional[float]:
+    value = os.getenv(name, "").strip()
+    return float(value) if value else None
+
+
+def _cache_enabled() -> bool:
+    return os.getenv("RAG_LLM_CACHE", "") == "1"
+
+
+def _cache_key(
+    model: str, temperature: float, max_tokens: int, system_prompt: str, structured_text: str
+) -> str:
+    return hashlib.sha256(
+        f"{model}|{temperature}|{max_tokens}|{system_prompt}|{structured_text}".encode("utf-8")
+    ).hexdigest()
+
+
+def _cache_get(key: str) -> Optional[str]:
+    """Return a cached narrative if present and younger than the TTL."""
+    if not _cache_enabled():
+        return None
+    cache_file = _cache_dir / f"{key}.txt"
+    try:
+        if time.time() - cache_file.stat().st_mtime > _cache_ttl():
+            return None
+        narrative = cache_file.read_text(encoding="utf-8")
+    except (OSError, ValueError):
+        return None
+    logger.info(f"Using cached narrative ({len(narrative)} characters)")
+    return narrative
+
+
+def _cache_ttl() -> float:
+    return float(os.getenv("RAG_LLM_CACHE_TTL", DEFAULT_CACHE_TTL))
+
+
+def _semantic_namespace(model: str, temperature: float, max_tokens: int, system_prompt: str) -> str:
+    """Semantic cache partition: everything but the prompt must match exactly."""
+    return _cache_key(model, temperature, max_tokens, system_prompt, "")
+
+
+def _cache_put(key: str, narrative: str):
+    """Store a narrative in the response cache (no-op when disabled)."""
+    if not _cache_enabled() or not narrative:
+        return
+    try:
+        _cache_dir.mkdir(parents=True, exist_ok=True)
+        (_cache_dir / f"{key}.txt").write_text(narrative, encoding="utf-8")
+    except OSError as e:
+        logger.warning(f"Could not write LLM cache entry: {e}")
+
+
+async def create_rate_limiter() -> RateLimiter:
+    """
+    Build a RateLimiter from RAG_LLM_MAX_RPM / RAG_LLM_MAX_TPM.
+
+    Limits that are not configured are left unlimited, unless
+    RAG_LLM_PROBE_LIMITS=1: then they are read from the provider's
+    x-ratelimit-* response headers using a (billed) 1-token request. If
+    probing fails, the corresponding bucket is left unlimited.
+    """
+    max_rpm = _env_float("RAG_LLM_MAX_RPM")
+    max_tpm = _env_float("RAG_LLM_MAX_TPM")
+    available_rpm = available_tpm = None
+
+    if (max_rpm is None or max_tpm is None) and os.getenv("RAG_LLM_PROBE_LIMITS", "") == "1":
+        try:
+            async with async_client_session() as client:
+                raw = await client.chat.completions.with_raw_response.create(
+                    model=get_llm_model(),
+                    messages=[{"role": "user", "content": "hi"}],
+                    max_tokens=1,
+                )
+            headers = raw.headers
+            if max_rpm is None and headers.get("x-ratelimit-limit-requests"):
+                max_rpm = float(headers["x-ratelimit-limit-requests"])
+                available_rpm = float(headers.get("x-ratelimit-remaining-requests", max_rpm))
+            if max_tpm is None and headers.get("x-ratelimit-limit-tokens"):
+                max_tpm = float(headers["x-ratelimit-limit-tokens"])
+                available_tpm = float(headers.get("x-ratelimit-remaining-tokens", max_tpm))
+        except Exception as e:
+            logger.debug(f"Rate limit probe failed, throttling only configured limits: {e}")
 
+    if max_rpm or max_tpm:
+        logger.info(f"LLM rate limits: {max_rpm or 'unlimited'} RPM, {max_tpm or 'unlimited'} TPM")
+    return RateLimiter(max_rpm, max_tpm, available_rpm, available_tpm)
+
+
+@functools.lru_cache(maxsize=8)
 def _load_style_prompt(style_profile: str) -> str:
     """
     Load style prompt from markdown file.
 
+    Memoized per style profile, so the file is read once per process
+    rather than once per slide.
+
     Args:
         style_profile: Style profile name (e.g., 'bruno')
 
@@ -30,16 +190,28 @@ def _load_style_prompt(style_profile: str) -> str:
     if not prompt_file.exists():
         raise FileNotFoundError(f"Style prompt file not found: {prompt_file}")
 
-    return prompt_file.read_text(encoding="utf-8")
+    return sys.intern(prompt_file.read_text(encoding="utf-8"))
+
 
+def _invalidate_style_cache():
+    """Clear memoized style prompts (e.g. after editing a prompt file)."""
+    _load_style_prompt.cache_clear()
 
-def invoke_style_replicator(text: str, style_profile: str = "bruno") -> str:
+
+def invoke_style_replicator(
+    text: str,
+    style_profile: str = "bruno",
+    stream: bool = False,
+    max_tokens: int = DEFAULT_MAX_TOKENS,
+) -> str:
     """
     Transform text into narrative style using LLM.
 
     Args:
         text: Structured text to transform
         style_profile: Style profile (currently only 'bruno' is supported)
+        stream: Stream the completion and assemble it as tokens arrive
+        max_tokens: Completion token budget (default: DEFAULT_MAX_TOKENS)
 
     Returns:
         Transformed narrative text
@@ -48,24 +220,228 @@ def invoke_style_replicator(text: str, style_profile: str = "bruno") -> str:
         ValueError: If RAG_LLM_API_KEY environment variable is not set
         Exception: If LLM transformation fails
     """
-    return _transform_via_llm(text, style_profile)
+    return _transform_via_llm(text, style_profile, stream=stream, max_tokens=max_tokens)
 
 
-def _transform_via_llm(structured_text: str, style_profile: str) -> str:
+async def ainvoke_style_replicator(
+    text: str,
+    style_profile: str = "bruno",
+    limiter: Optional[RateLimiter] = None,
+    stream: bool = False,
+    max_tokens: int = DEFAULT_MAX_TOKENS,
+    on_latency: Optional[Callable[[float], None]] = None,
+) -> str:
     """
-    Transform structured notes using LLM API directly.
+    Async variant of invoke_style_replicator for concurrent slide processing.
 
     Args:
-        structured_text: Structured speaker notes to transform
-        style_profile: Style profile name (e.g., 'bruno', 'generic', or any profile
-                       with a corresponding <style_profile>_speaking_style.md file)
+        text: Structured text to transform
+        style_profile: Style profile (currently only 'bruno' is supported)
+        limiter: Optional shared RateLimiter throttling concurrent calls
+        stream: Stream the completion and assemble it as tokens arrive
+        max_tokens: Completion token budget (default: DEFAULT_MAX_TOKENS)
+        on_latency: Called with the seconds each API round-trip took (cache
+                    hits and limiter waits are not reported)
 
     Returns:
-        Narrative text in specified style
+        Transformed narrative text
+
+    Raises:
+        ValueError: If RAG_LLM_API_KEY environment variable is not set
+        Exception: If LLM transformation fails
+    """
+    async with async_client_session():
+        return await _atransform_via_llm(
+            text, style_profile, limiter, stream=stream, max_tokens=max_tokens, on_latency=on_latency
+        )
+
+
+async def ainvoke_style_replicator_many(
+    items: List[Dict[str, str]],
+    style_profile: str = "bruno",
+    instructions: str = "",
+    limiter: Optional[RateLimiter] = None,
+    max_tokens: int = DEFAULT_MAX_TOKENS,
+) -> Dict[str, str]:
+    """
+    Transform several slides with one structured-output chat completion.
+
+    Saves one round-trip per slide and lets the model see neighbouring
+    slides; best kept to a handful of slides per call to stay well inside
+    the context and output limits.
+
+    Args:
+        items: Slides as {"id": ..., "text": ...} (text is the per-slide prompt)
+        style_profile: Style profile (currently only 'bruno' is supported)
+        instructions: Shared instructions sent once ahead of the slides
+        limiter: Optional shared RateLimiter throttling concurrent calls
+        max_tokens: Completion token budget for the whole response
+
+    Returns:
+        Mapping of id -> narrative (slides the model skipped are omitted)
+
+    Raises:
+        ValueError: If RAG_LLM_API_KEY environment variable is not set
+        Exception: If LLM transformation fails or returns invalid JSON
+    """
+    async with async_client_session():
+        return await _atransform_batch_via_llm(items, style_profile, instructions, limiter, max_tokens)
+
+
+def stream_style_replicator(
+    text: str,
+    style_profile: str = "bruno",
+    max_tokens: int = DEFAULT_MAX_TOKENS,
+) -> Iterator[str]:
+    """
+    Streaming variant of invoke_style_replicator yielding whole sentences.
+
+    Sentences are yielded as soon as the model finishes them, so sentence-level
+    consumers (TTS, previews) can start before generation ends. Each sentence
+    keeps its trailing whitespace: "".join() of the output is the narrative.
+
+    Args:
+        text: Structured text to transform
+        style_profile: Style profile (currently only 'bruno' is supported)
+        max_tokens: Completion token budget (default: DEFAULT_MAX_TOKENS)
+
+    Yields:
+        Narrative sentences in order
+
+    Raises:
+        ValueError: If RAG_LLM_API_KEY environment variable is not set
+        Exception: If LLM transformation fails
+    """
+    model = get_llm_model()
+    temperature = 0.7
+    system_prompt = _resolve_system_prompt(style_profile)
+
+    cache_key = _cache_key(model, temperature, max_tokens, system_prompt, text)
+    cached = _cache_get(cache_key)
+    if cached is not None:
+        yield from _split_sentences(cached)
+        return
+
+    response = _get_client().chat.completions.create(
+        model=model,
+        messages=[
+            {"role": "system", "content": system_prompt},
+            {"role": "user", "content": text}
+        ],
+        temperature=temperature,
+        max_tokens=max_tokens,
+        stream=True,
+    )
+    sentences = []
+    for sentence in _stream_sentences(response):
+        sentences.append(sentence)
+        yield sentence
+
+    narrative = "".join(sentences)
+    logger.info(f"Generated {len(narrative)} characters of narrative notes")
+    _cache_put(cache_key, narrative)
+
+
+async def astream_style_replicator(
+    text: str,
+    style_profile: str = "bruno",
+    limiter: Optional[RateLimiter] = None,
+    max_tokens: int = DEFAULT_MAX_TOKENS,
+) -> AsyncIterator[str]:
+    """
+    Async variant of stream_style_replicator.
+
+    Args:
+        text: Structured text to transform
+        style_profile: Style profile (currently only 'bruno' is supported)
+        limiter: Optional shared RateLimiter throttling concurrent calls
+        max_tokens: Completion token budget (default: DEFAULT_MAX_TOKENS)
+
+    Yields:
+        Narrative sentences in order (with trailing whitespace)
+
+    Raises:
+        ValueError: If RAG_LLM_API_KEY environment variable is not set
+        Exception: If LLM transformation fails
+    """
+    model = get_llm_model()
+    temperature = 0.7
+    system_prompt = _resolve_system_prompt(style_profile)
+
+    cache_key = _cache_key(model, temperature, max_tokens, system_prompt, text)
+    cached = _cache_get(cache_key)
+    if cached is not None:
+        for sentence in _split_sentences(cached):
+            yield sentence
+        return
+
+    sentences = []
+    async with async_client_session():
+        response = await _acreate_completion(
+            system_prompt, text, limiter,
+            model=model, temperature=temperature, max_tokens=max_tokens, stream=True,
+        )
+        async for sentence in _astream_sentences(response):
+            sentences.append(sentence)
+            yield sentence
+
+    narrative = "".join(sentences)
+    logger.info(f"Generated {len(narrative)} characters of narrative notes")
+    _cache_put(cache_key, narrative)
+
+
+class _SentenceSplitter:
+    """Accumulate streamed text and release it one complete sentence at a time."""
+
+    def __init__(self):
+        self.buffer = ""
+
+    def feed(self, delta: str) -> List[str]:
+        """Add a delta and return the sentences it completed."""
+        self.buffer += delta
+        # split() with a capture group alternates text and separator; the last
+        # item is the still-open sentence
+        parts = _SENTENCE_END.split(self.buffer)
+        self.buffer = parts.pop()
+        return [parts[i] + parts[i + 1] for i in range(0, len(parts), 2)]
+
+    def close(self) -> List[str]:
+        """Return whatever is left once the stream ends."""
+        rest, self.buffer = self.buffer, ""
+        return [rest] if rest else []
+
+
+def _split_sentences(text: str) -> List[str]:
+    splitter = _SentenceSplitter()
+    return splitter.feed(text) + splitter.close()
+
+
+def _stream_sentences(response) -> Iterator[str]:
+    """Yield complete sentences from a streamed chat completion."""
+    splitter = _SentenceSplitter()
+    for chunk in response:
+        if chunk.choices:
+            yield from splitter.feed(chunk.choices[0].delta.content or "")
+    yield from splitter.close()
+
+
+async def _astream_sentences(response) -> AsyncIterator[str]:
+    """Yield complete sentences from an async streamed chat completion."""
+    splitter = _SentenceSplitter()
+    async for chunk in response:
+        if chunk.choices:
+            for sentence in splitter.feed(chunk.choices[0].delta.content or ""):
+                yield sentence
+    for sentence in splitter.close():
+        yield sentence
+
+
+def _client_kwargs() -> Dict[str, Any]:
+    """
+    Build OpenAI client arguments from environment variables.
 
     Raises:
         ValueError: If RAG_LLM_API_KEY is not set
-        Exception: If API call fails
     """
     api_key = os.getenv("RAG_LLM_API_KEY", "")
     base_url = os.getenv("RAG_LLM_BASE_URL")
@@ -79,12 +455,66 @@ def _transform_via_llm(structured_text: str, style_profile: str) -> str:
     kwargs = {"api_key": api_key}
     if base_url:
         kwargs["base_url"] = base_url
+    return kwargs
 
-    client = OpenAI(**kwargs)
 
-    # Load style prompt from file
+@functools.lru_cache(maxsize=1)
+def _get_client() -> OpenAI:
+    """
+    Shared OpenAI client, so all requests reuse one HTTP connection pool.
+
+    Environment variables are read on first use; call _reset_client()
+    after changing them.
+    """
+    return OpenAI(**_client_kwargs())
+
+
+# Client of the enclosing async_client_session(). Not a process-wide
+# singleton: httpx async connections cannot outlive the loop that opened them.
+_session_client: contextvars.ContextVar[Optional[AsyncOpenAI]] = contextvars.ContextVar(
+    "_session_client", default=None
+)
+
+
+@contextlib.asynccontextmanager
+async def async_client_session() -> AsyncIterator[AsyncOpenAI]:
+    """
+    Share one AsyncOpenAI client (and connection pool) across the block.
+
+    Nested sessions reuse the enclosing client; the outermost one closes it
+    on exit. Tasks started inside the block inherit the client.
+    """
+    client = _session_client.get()
+    if client is not None:
+        yield client
+        return
+
+    client = AsyncOpenAI(**_client_kwargs())
+    token = _session_client.set(client)
     try:
-        system_prompt = _load_style_prompt(style_profile)
+        yield client
+    finally:
+        _session_client.reset(token)
+        await client.close()
+
+
+def _get_async_client() -> AsyncOpenAI:
+    """AsyncOpenAI client of the enclosing async_client_session()."""
+    client = _session_client.get()
+    if client is None:
+        raise RuntimeError("AsyncOpenAI client used outside async_client_session()")
+    return client
+
+
+def _reset_client():
+    """Drop the shared sync client (e.g. in tests or after changing env vars)."""
+    _get_client.cache_clear()
+
+
+def _resolve_system_prompt(style_profile: str) -> str:
+    """Load the style prompt, falling back to a generic conversational style."""
+    try:
+        return _load_style_prompt(style_profile)
     except FileNotFoundError:
         # Fallback to generic conversational style
         prompt_dir = Path(__file__).parent.parent / "prompts"
@@ -93,26 +523,347 @@ def _transform_via_llm(structured_text: str, style_profile: str) -> str:
             f"Style profile '{style_profile}' not found at {expected_path}, "
             f"using generic conversational style"
         )
-        system_prompt = """You are transforming structured speaker notes into a natural, conversational narrative script.
+        return _GENERIC_SYSTEM_PROMPT
 
-Make it sound like someone actually speaking to an audience, not reading bullet points.
-Keep the content accurate but make the delivery engaging and natural."""
+
+def _transform_via_llm(
+    structured_text: str,
+    style_profile: str,
+    stream: bool = False,
+    max_tokens: int = DEFAULT_MAX_TOKENS,
+) -> str:
+    """
+    Transform structured notes using LLM API directly.
+
+    Args:
+        structured_text: Structured speaker notes to transform
+        style_profile: Style profile name (e.g., 'bruno', 'generic', or any profile
+                       with a corresponding <style_profile>_speaking_style.md file)
+        stream: Request a streamed completion (first tokens arrive after TTFT
+                instead of after the full generation) and join the deltas
+        max_tokens: Completion token budget; a tight budget lets the provider
+                    reserve less capacity for the request
+
+    Returns:
+        Narrative text in specified style
+
+    Raises:
+        ValueError: If RAG_LLM_API_KEY is not set
+        Exception: If API call fails
+    """
+    model = get_llm_model()
+    temperature = 0.7
+    system_prompt = _resolve_system_prompt(style_profile)
+
+    cache_key = _cache_key(model, temperature, max_tokens, system_prompt, structured_text)
+    cached = _cache_get(cache_key)
+    if cached is not None:
+        return cached
+
+    client = _get_client()
+
+    vector = None
+    if semantic_cache.enabled():
+        namespace = _semantic_namespace(model, temperature, max_tokens, system_prompt)
+        vector = semantic_cache.embed(client, structured_text)
+        if vector is not None:
+            cached = semantic_cache.lookup(namespace, vector, _cache_ttl())
+            if cached is not None:
+                return cached
 
     try:
         response = client.chat.completions.create(
-            model="gpt-4o",
+            model=model,
             messages=[
                 {"role": "system", "content": system_prompt},
                 {"role": "user", "content": structured_text}
             ],
-            temperature=0.7,
-            max_tokens=2000,
+            temperature=temperature,
+            max_tokens=max_tokens,
+            stream=stream,
         )
 
-        narrative = response.choices[0].message.content or ""
+        if stream:
+            narrative = "".join(
+                chunk.choices[0].delta.content or ""
+                for chunk in response
+                if chunk.choices
+            )
+        else:
+            narrative = response.choices[0].message.content or ""
         logger.info(f"Generated {len(narrative)} characters of narrative notes")
+        _cache_put(cache_key, narrative)
+        if vector is not None:
+            semantic_cache.store(namespace, vector, narrative)
         return narrative
 
     except Exception as e:
         logger.exception("LLM transformation failed")
         raise
+
+
+async def _atransform_via_llm(
+    structured_text: str,
+    style_profile: str,
+    limiter: Optional[RateLimiter] = None,
+    stream: bool = False,
+    max_tokens: int = DEFAULT_MAX_TOKENS,
+    on_latency: Optional[Callable[[float], None]] = None,
+) -> str:
+    """
+    Async counterpart of _transform_via_llm using AsyncOpenAI.
+
+    Requests are released through the limiter (if given); 429 responses that
+    still occur are retried with backoff, honouring Retry-After.
+
+    Args:
+        structured_text: Structured speaker notes to transform
+        style_profile: Style profile name
+        limiter: Optional shared RateLimiter
+        stream: Request a streamed completion and join the deltas
+        max_tokens: Completion token budget
+        on_latency: Optional callback given each API round-trip's duration
+
+    Returns:
+        Narrative text in specified style
+
+    Raises:
+        ValueError: If RAG_LLM_API_KEY is not set
+        Exception: If API call fails
+    """
+    model = get_llm_model()
+    temperature = 0.7
+    system_prompt = _resolve_system_prompt(style_profile)
+
+    cache_key = _cache_key(model, temperature, max_tokens, system_prompt, structured_text)
+    cached = _cache_get(cache_key)
+    if cached is not None:
+        return cached
+
+    vector = None
+    if semantic_cache.enabled():
+        namespace = _semantic_namespace(model, temperature, max_tokens, system_prompt)
+        vector = await semantic_cache.aembed(_get_async_client(), structured_text)
+        if vector is not None:
+            cached = semantic_cache.lookup(namespace, vector, _cache_ttl())
+            if cached is not None:
+                return cached
+
+    try:
+        response = await _acreate_completion(
+            system_prompt, structured_text, limiter, on_latency,
+            model=model, temperature=temperature, max_tokens=max_tokens, stream=stream,
+        )
+
+        if stream:
+            parts = []
+            async for chunk in response:
+                if chunk.choices:
+                    parts.append(chunk.choices[0].delta.content or "")
+            narrative = "".join(parts)
+        else:
+            narrative = response.choices[0].message.content or ""
+        logger.info(f"Generated {len(narrative)} characters of narrative notes")
+        _cache_put(cache_key, narrative)
+        if vector is not None:
+            semantic_cache.store(namespace, vector, narrative)
+        return narrative
+
+    except Exception:
+        logger.exception("LLM transformation failed")
+        raise
+
+
+@retry(1, (RateLimitError,), RATE_LIMIT_MAX_RETRIES, RATE_LIMIT_BASE_DELAY)
+async def _acreate_completion(
+    system_prompt: str,
+    structured_text: str,
+    limiter: Optional[RateLimiter] = None,
+    on_latency: Optional[Callable[[float], None]] = None,
+    **params: Any,
+):
+    """
+    Issue one chat completion through the limiter, retrying 429s with backoff
+    (honouring Retry-After); each retry waits for the limiter again.
+
+    Args:
+        system_prompt: Style system prompt
+        structured_text: User message
+        limiter: Optional shared RateLimiter
+        on_latency: Optional callback given the duration of the create() call
+                    alone (time spent waiting for the limiter is excluded)
+        **params: Remaining create() arguments (model, max_tokens, stream, ...)
+
+    Returns:
+        The completion, or the async stream if params request one
+    """
+    client = _get_async_client()
+    max_tokens = params.get("max_tokens", DEFAULT_MAX_TOKENS)
+    est_tokens = (len(system_prompt) + len(structured_text)) // 4 + max_tokens
+
+    async with limiter.acquire(est_tokens) if limiter else contextlib.nullcontext():
+        started = time.monotonic()
+        response = await client.chat.completions.create(
+            messages=[
+                {"role": "system", "content": system_prompt},
+                {"role": "user", "content": structured_text}
+            ],
+            **params,
+        )
+        if on_latency:
+            on_latency(time.monotonic() - started)
+        return response
+
+
+async def _atransform_batch_via_llm(
+    items: List[Dict[str, str]],
+    style_profile: str,
+    instructions: str = "",
+    limiter: Optional[RateLimiter] = None,
+    max_tokens: int = DEFAULT_MAX_TOKENS,
+) -> Dict[str, str]:
+    """
+    Transform several slides in one completion constrained by _NARRATIVES_SCHEMA.
+
+    Args:
+        items: Slides as {"id": ..., "text": ...}
+        style_profile: Style profile name
+        instructions: Shared instructions sent once ahead of the slides
+        limiter: Optional shared RateLimiter
+        max_tokens: Completion token budget (capped at MULTI_SLIDE_MAX_TOKENS)
+
+    Returns:
+        Mapping of id -> narrative
+
+    Raises:
+        ValueError: If RAG_LLM_API_KEY is not set
+        Exception: If API call fails or the response is not valid JSON
+    """
+    system_prompt = _resolve_system_prompt(style_profile)
+    user_content = (
+        f"{instructions}"
+        f"Write one narrative per slide in the JSON array below. "
+        f"Return each narrative with the id of its slide.\n\n"
+        f"{json.dumps(items, ensure_ascii=False)}"
+    )
+
+    try:
+        response = await _acreate_completion(
+            system_prompt, user_content, limiter,
+            model=get_llm_model(),
+            temperature=0.7,
+            max_tokens=min(max_tokens, MULTI_SLIDE_MAX_TOKENS),
+            response_format={
+                "type": "json_schema",
+                "json_schema": {"name": "narratives", "schema": _NARRATIVES_SCHEMA, "strict": True},
+            },
+        )
+        payload = json.loads(response.choices[0].message.content or "{}")
+    except Exception:
+        logger.exception("Multi-slide LLM transformation failed")
+        raise
+
+    wanted = {item["id"] for item in items}
+    narratives = {
+        entry["id"]: entry["narrative"]
+        for entry in payload.get("narratives", [])
+        if entry.get("id") in wanted and entry.get("narrative")
+    }
+    logger.info(f"Generated narratives for {len(narratives)}/{len(items)} slides in one request")
+    return narratives
+
+
+def run_style_batch(
+    texts: Dict[str, str],
+    style_profile: str = "bruno",
+    max_tokens: Optional[Dict[str, int]] = None,
+) -> Dict[str, str]:
+    """
+    Transform many texts with one OpenAI Batch API job.
+
+    Uploads one JSONL line per text, polls the job with exponential backoff
+    until it finishes, then maps the results back by custom_id. Cached
+    narratives are reused and not resubmitted.
+
+    Args:
+        texts: Mapping of custom_id -> structured text
+        style_profile: Style profile name
+        max_tokens: Optional mapping of custom_id -> completion token budget
+                    (missing entries use DEFAULT_MAX_TOKENS)
+
+    Returns:
+        Mapping of custom_id -> narrative (failed requests are omitted)
+
+    Raises:
+        ValueError: If RAG_LLM_API_KEY is not set
+        RuntimeError: If the batch job fails, expires or is cancelled
+    """
+    model = get_llm_model()
+    temperature = 0.7
+    system_prompt = _resolve_system_prompt(style_profile)
+
+    results = {}
+    cache_keys = {}
+    lines = []
+    for custom_id, text in texts.items():
+        budget = (max_tokens or {}).get(custom_id, DEFAULT_MAX_TOKENS)
+        cache_keys[custom_id] = _cache_key(model, temperature, budget, system_prompt, text)
+        cached = _cache_get(cache_keys[custom_id])
+        if cached is not None:
+            results[custom_id] = cached
+            continue
+        lines.append(json.dumps({
+            "custom_id": custom_id,
+            "method": "POST",
+            "url": "/v1/chat/completions",
+            "body": {
+                "model": model,
+                "messages": [
+                    {"role": "system", "content": system_prompt},
+                    {"role": "user", "content": text}
+                ],
+                "temperature": temperature,
+                "max_tokens": budget,
+            },
+        }, ensure_ascii=False))
+
+    if not lines:
+        return results
+
+    client = _get_client()
+    batch_file = client.files.create(
+        file=("speaker_notes_batch.jsonl", "\n".join(lines).encode("utf-8")),
+        purpose="batch",
+    )
+    batch = client.batches.create(
+        input_file_id=batch_file.id,
+        endpoint="/v1/chat/completions",
+        completion_window="24h",
+    )
+    logger.info(f"Submitted batch {batch.id} with {len(lines)} requests")
+
+    delay = BATCH_POLL_INITIAL_DELAY
+    while batch.status not in ("completed", "failed", "expired", "cancelled"):
+        time.sleep(delay)
+        delay = min(delay * 2, BATCH_POLL_MAX_DELAY)
+        batch = client.batches.retrieve(batch.id)
+        logger.info(f"  Batch {batch.id}: {batch.status}")
+
+    if batch.status != "completed" or not batch.output_file_id:
+        raise RuntimeError(f"Batch {batch.id} ended with status '{batch.status}'")
+
+    for line in client.files.content(batch.output_file_id).text.splitlines():
+        if not line.strip():
+            continue
+        record = json.loads(line)
+        custom_id = record.get("custom_id")
+        response = record.get("response") or {}
+        if response.get("status_code") != 200:
+            logger.warning(f"  Batch request {custom_id} failed: {record.get('error')}")
+            continue
+        narrative = response["body"]["choices"][0]["message"]["content"] or ""
+        results[custom_id] = narrative
+        _cache_put(cache_keys[custom_id], narrative)
+
+    logger.info(f"Batch {batch.id} returned {len(results)} narratives")
+    return results
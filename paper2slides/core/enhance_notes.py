@@ -3,23 +3,106 @@ Speaker Notes Enhancement
 
 Transforms structured speaker notes into narrative form using style-replicator agent.
 """
+import asyncio
+import hashlib
+import json
 import logging
+import re
+import statistics
+import time
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, Any
+from typing import Callable, Dict, Any, List, Optional
 
 from paper2slides.utils import load_json, save_json
-from paper2slides.core.agent_integration import invoke_style_replicator
+from paper2slides.core.agent_integration import (
+    BATCH_MIN_REQUESTS,
+    DEFAULT_MAX_TOKENS,
+    RateLimiter,
+    ainvoke_style_replicator,
+    ainvoke_style_replicator_many,
+    astream_style_replicator,
+    async_client_session,
+    create_rate_limiter,
+    get_llm_model,
+    run_style_batch,
+)
 
 logger = logging.getLogger(__name__)
 
+# Static instructions, sent as the literal prefix of every user message.
+# Keep this text byte-stable: any change breaks provider-side prefix caching.
+STATIC_USER_PREFIX = """Transform the bullet-point talking points below into a complete narrative script that a speaker can read aloud naturally. The script should:
+- Be conversational and engaging
+- Incorporate the key terms naturally
+- Fit the stated duration
+- End with the transition phrase
+- Match the speaker's personal style (informal, direct, uses "here's the thing", parenthetical asides, etc.)
+
+---
+
+"""
 
-def enhance_speaker_notes(checkpoint_path: str, style_profile: str = "bruno") -> int:
+# Slide content is only context for the rewrite: cap it, and drop it entirely
+# when it mostly repeats the talking points
+CONTEXT_MAX_CHARS = 200
+CONTEXT_OVERLAP_THRESHOLD = 0.7
+
+# Narrative token budget: ~260 tokens per minute of speech, floored so short
+# slides still have room, capped at the previous flat budget
+TOKENS_PER_MINUTE = 260
+MIN_NARRATIVE_TOKENS = 400
+
+# Hedged requests (opt-in): once HEDGE_MIN_SAMPLES API calls have completed, a
+# request still outstanding after HEDGE_LATENCY_FACTOR x their median latency
+# gets a duplicate, and whichever answers first wins
+HEDGE_MIN_SAMPLES = 5
+HEDGE_LATENCY_FACTOR = 2.0
+
+# Section key storing the fingerprint of the inputs that produced the narrative
+FINGERPRINT_KEY = "speaker_notes_narrative_fingerprint"
+
+
+@dataclass
+class _SlideJob:
+    """A section selected for enhancement, with its prompt and fingerprint."""
+    index: int
+    slide_id: str
+    section: Dict[str, Any]
+    structured_text: str
+    fingerprint: str
+
+
+def enhance_speaker_notes(
+    checkpoint_path: str,
+    style_profile: str = "bruno",
+    max_concurrency: int = 10,
+    stream: bool = False,
+    use_batch: bool = False,
+    force: bool = False,
+    slides_per_request: int = 1,
+    hedge: bool = False,
+) -> int:
     """
     Enhance speaker notes in checkpoint_plan.json with narrative style.
 
+    All slides are transformed concurrently; max_concurrency bounds the number
+    of in-flight LLM requests to stay within provider rate limits. With
+    use_batch, large decks go through the OpenAI Batch API instead (half the
+    cost, results within 24 hours). With slides_per_request > 1, slides are
+    grouped into structured-output requests of that many slides each.
+
     Args:
         checkpoint_path: Path to checkpoint_plan.json file
         style_profile: Style profile to use (default: bruno)
+        max_concurrency: Maximum number of concurrent LLM requests (default: 10)
+        stream: Stream completions, writing narratives through sentence by sentence (default: False)
+        use_batch: Submit one Batch API job for decks of BATCH_MIN_REQUESTS+ slides
+        force: Re-enhance slides whose narrative fingerprint is already up to date
+        slides_per_request: Slides per chat completion (default: 1; ~5 works well;
+                            ignored when streaming)
+        hedge: Duplicate requests that run well past the median latency
+               (costs extra tokens; ignored when streaming)
 
     Returns:
         Number of slides enhanced
@@ -42,37 +125,23 @@ def enhance_speaker_notes(checkpoint_path: str, style_profile: str = "bruno") ->
         logger.warning("No sections found in checkpoint")
         return 0
 
-    # Enhance each section's speaker notes
-    enhanced_count = 0
-    for idx, section in enumerate(sections, 1):
-        slide_id = section.get("id", f"slide_{idx:02d}")
-        title = section.get("title", "")
-        content = section.get("content", "")
-        speaker_notes = section.get("speaker_notes", {})
-
-        # Skip if no structured speaker notes
-        if not speaker_notes or not speaker_notes.get("talking_points"):
-            logger.info(f"  [{idx}/{len(sections)}] {slide_id}: No structured notes, skipping")
-            continue
-
-        logger.info(f"  [{idx}/{len(sections)}] {slide_id}: Enhancing speaker notes...")
-
-        try:
-            # Transform structured notes to narrative
-            narrative_notes = _transform_to_narrative(
-                title=title,
-                content=content,
-                speaker_notes=speaker_notes,
-                style_profile=style_profile
+    to_enhance = _sections_to_enhance(sections, style_profile, force)
+    if use_batch and len(to_enhance) >= BATCH_MIN_REQUESTS:
+        enhanced_count = _enhance_sections_batch(to_enhance, style_profile)
+    else:
+        if use_batch:
+            logger.info(
+                f"Batch not worth it for small decks ({len(to_enhance)} < {BATCH_MIN_REQUESTS} slides), "
+                f"using concurrent requests"
             )
-
-            # Add enhanced narrative to section (keep structured notes for reference)
-            section["speaker_notes_narrative"] = narrative_notes
-            enhanced_count += 1
-
-        except Exception:
-            logger.exception(f"  Failed to enhance {slide_id}")
-            continue
+        # Enhance all sections concurrently
+        saver = _CheckpointSaver(checkpoint_file, checkpoint_data)
+        enhanced_count = asyncio.run(
+            _enhance_sections(
+                to_enhance, len(sections), style_profile, max_concurrency, stream, saver,
+                slides_per_request, hedge,
+            )
+        )
 
     # Save enhanced checkpoint
     if enhanced_count > 0:
@@ -103,35 +172,372 @@ def enhance_speaker_notes(checkpoint_path: str, style_profile: str = "bruno") ->
     return enhanced_count
 
 
-def _transform_to_narrative(
-    title: str,
-    content: str,
-    speaker_notes: Dict[str, Any],
-    style_profile: str
-) -> str:
+class _LatencyTracker:
+    """Observed request latencies, used to decide when to hedge a slow one."""
+
+    def __init__(self):
+        self.samples: List[float] = []
+        # Set once hedge_after() has enough samples to answer
+        self.ready = asyncio.Event()
+
+    def observe(self, seconds: float):
+        self.samples.append(seconds)
+        if len(self.samples) >= HEDGE_MIN_SAMPLES:
+            self.ready.set()
+
+    def hedge_after(self) -> Optional[float]:
+        """Seconds to wait before hedging, or None until enough samples exist."""
+        if len(self.samples) < HEDGE_MIN_SAMPLES:
+            return None
+        return HEDGE_LATENCY_FACTOR * statistics.median(self.samples)
+
+
+class _CheckpointSaver:
+    """
+    Flush the checkpoint periodically while slides are being enhanced.
+
+    Saves after every `every` completed slides or `interval` seconds, so a
+    crash late in a long deck keeps the narratives already paid for.
     """
-    Transform structured speaker notes into narrative form.
 
-    Uses the style-replicator agent (or custom logic) to generate
-    a full narrative script from structured talking points.
+    def __init__(self, path: Path, data: Dict[str, Any], every: int = 5, interval: float = 10.0):
+        self.path = path
+        self.data = data
+        self.every = every
+        self.interval = interval
+        self.enhanced_since_save = 0
+        self.dirty = False
+        self.last_save = time.monotonic()
+
+    def record(self):
+        """Note one completed slide and flush if a threshold is reached."""
+        self.enhanced_since_save += 1
+        if (self.enhanced_since_save >= self.every
+                or time.monotonic() - self.last_save > self.interval):
+            self.flush()
+
+    def touch(self):
+        """Note a partial update (a streamed sentence); flush on the interval only."""
+        self.dirty = True
+        if time.monotonic() - self.last_save > self.interval:
+            self.flush()
+
+    def flush(self):
+        """Write pending narratives to disk."""
+        if self.enhanced_since_save == 0 and not self.dirty:
+            return
+        save_json(self.path, self.data)
+        self.enhanced_since_save = 0
+        self.dirty = False
+        self.last_save = time.monotonic()
+
+
+def _sections_to_enhance(
+    sections: List[Dict[str, Any]],
+    style_profile: str,
+    force: bool = False,
+) -> List[_SlideJob]:
+    """
+    Select sections that need a (new) narrative.
+
+    Sections without structured notes are skipped, as are sections whose
+    stored fingerprint matches the current prompt, style and model (unless
+    force is set), so reruns only pay for slides that changed.
+    """
+    model = get_llm_model()
+    selected = []
+    for idx, section in enumerate(sections, 1):
+        slide_id = section.get("id", f"slide_{idx:02d}")
+        speaker_notes = section.get("speaker_notes", {})
+
+        # Skip if no structured speaker notes
+        if not speaker_notes or not speaker_notes.get("talking_points"):
+            logger.info(f"  [{idx}/{len(sections)}] {slide_id}: No structured notes, skipping")
+            continue
+
+        structured_text = _build_structured_text(
+            section.get("title", ""), section.get("content", ""), speaker_notes
+        )
+        fingerprint = hashlib.sha256(json.dumps(
+            {"prompt": structured_text, "style_profile": style_profile, "model": model},
+            sort_keys=True,
+        ).encode("utf-8")).hexdigest()
+
+        if (not force and section.get("speaker_notes_narrative")
+                and section.get(FINGERPRINT_KEY) == fingerprint):
+            logger.info(f"  [{idx}/{len(sections)}] {slide_id}: Narrative up to date, skipping")
+            continue
+
+        selected.append(_SlideJob(idx, slide_id, section, structured_text, fingerprint))
+    return selected
+
+
+async def _enhance_sections(
+    to_enhance: List[_SlideJob],
+    total: int,
+    style_profile: str,
+    max_concurrency: int,
+    stream: bool = False,
+    saver: Optional[_CheckpointSaver] = None,
+    slides_per_request: int = 1,
+    hedge: bool = False,
+) -> int:
+    """
+    Transform the selected sections concurrently, bounded by a semaphore.
+
+    Longest prompts are dispatched first so short slides fill in the tail
+    instead of one long slide finishing last. With hedge (and no streaming),
+    a request that runs well past the median API latency is duplicated and
+    the first answer wins (the API has no server-side cancel, so a second
+    request often beats a stalled one). The duplicate is only sent when a
+    semaphore slot is free, takes that slot, and goes through the rate
+    limiter like any request.
 
     Args:
-        title: Slide title
-        content: Slide content
-        speaker_notes: Structured speaker notes dict with talking_points, etc.
+        to_enhance: Jobs from _sections_to_enhance (sections updated in place)
+        total: Total number of sections in the plan (for progress logs)
         style_profile: Style profile name
+        max_concurrency: Maximum number of concurrent LLM requests
+        stream: Use streamed completions
+        saver: Optional checkpoint saver notified as each slide completes
+        slides_per_request: Group this many slides per request; slides missing
+                            from a grouped response are retried one by one
+        hedge: Hedge slow single-slide requests with a duplicate
 
     Returns:
-        Narrative speaker notes as a string
+        Number of sections enhanced
+    """
+    if not to_enhance:
+        return 0
+    semaphore = asyncio.Semaphore(max_concurrency)
+    limiter = await create_rate_limiter()
+
+    # Two streams would interleave their write-through, so never hedge those
+    hedge = hedge and not stream
+    latencies = _LatencyTracker()
+    on_latency = latencies.observe if hedge else None
+
+    async def attempt(job: _SlideJob) -> str:
+        return await _atransform_to_narrative(job, style_profile, limiter, stream, saver, on_latency)
+
+    async def start_hedge(job: _SlideJob) -> Optional[asyncio.Task]:
+        # Only on spare capacity: the caller already holds a slot, so waiting
+        # for another one could stall behind itself
+        if semaphore.locked():
+            return None
+        await semaphore.acquire()  # a slot is free, so this returns at once
+        task = asyncio.create_task(attempt(job))
+        task.add_done_callback(lambda _: semaphore.release())
+        return task
+
+    async def enhance_one(job: _SlideJob) -> str:
+        async with semaphore:
+            logger.info(f"  [{job.index}/{total}] {job.slide_id}: Enhancing speaker notes...")
+            if not hedge:
+                return await attempt(job)
+            return await _hedged(job, lambda: attempt(job), lambda: start_hedge(job), latencies, total)
+
+    async def enhance_group(group: List[_SlideJob]) -> Dict[str, str]:
+        async with semaphore:
+            logger.info(f"  Enhancing {len(group)} slides in one request: {', '.join(j.slide_id for j in group)}")
+            return await ainvoke_style_replicator_many(
+                [{"id": _request_id(j), "text": j.structured_text[len(STATIC_USER_PREFIX):]} for j in group],
+                style_profile,
+                STATIC_USER_PREFIX,
+                limiter,
+                max_tokens=sum(_narrative_token_budget(j.section["speaker_notes"]) for j in group),
+            )
+
+    async def from_group(job: _SlideJob, group_task: asyncio.Task) -> str:
+        try:
+            narrative = (await group_task).get(_request_id(job))
+        except Exception:
+            narrative = None
+        if narrative:
+            return narrative
+        logger.info(f"  [{job.index}/{total}] {job.slide_id}: Missing from grouped response, retrying alone")
+        return await enhance_one(job)
+
+    # One client (and connection pool) for every request of this run, closed
+    # when the run ends; the tasks below inherit it
+    async with async_client_session():
+        # Identical prompts (repeated "Questions?" slides, etc.) share one request;
+        # work is dispatched longest prompt first
+        unique: Dict[str, _SlideJob] = {}
+        key_for: Dict[int, str] = {}
+        for job in sorted(to_enhance, key=lambda j: len(j.structured_text), reverse=True):
+            key = hashlib.sha256(job.structured_text.encode("utf-8")).hexdigest()
+            if key in unique:
+                logger.info(f"  [{job.index}/{total}] {job.slide_id}: Same notes as an earlier slide, reusing narrative")
+            else:
+                unique[key] = job
+            key_for[job.index] = key
+
+        seen: Dict[str, asyncio.Task] = {}
+        if slides_per_request > 1 and not stream:
+            keys = list(unique)
+            for start in range(0, len(keys), slides_per_request):
+                group_keys = keys[start:start + slides_per_request]
+                if len(group_keys) == 1:
+                    seen[group_keys[0]] = asyncio.create_task(enhance_one(unique[group_keys[0]]))
+                    continue
+                group_task = asyncio.create_task(enhance_group([unique[k] for k in group_keys]))
+                for key in group_keys:
+                    seen[key] = asyncio.create_task(from_group(unique[key], group_task))
+        else:
+            for key, job in unique.items():
+                seen[key] = asyncio.create_task(enhance_one(job))
+        tasks = [seen[key_for[job.index]] for job in to_enhance]
+
+        async def splice(job: _SlideJob, task: asyncio.Task):
+            try:
+                narrative = await task
+            except Exception as e:
+                logger.warning(f"  {job.slide_id}: Style transformation failed, using fallback: {e}")
+                _apply_narrative(job, _fallback_for(job), None)
+            else:
+                _apply_narrative(job, narrative, job.fingerprint)
+            if saver:
+                saver.record()
+
+        results = await asyncio.gather(
+            *(splice(job, task) for job, task in zip(to_enhance, tasks)),
+            return_exceptions=True,
+        )
+
+    enhanced_count = 0
+    for job, result in zip(to_enhance, results):
+        if isinstance(result, Exception):
+            logger.error(f"  Failed to enhance {job.slide_id}", exc_info=result)
+            continue
+        enhanced_count += 1
+
+    return enhanced_count
+
+
+async def _hedged(job: _SlideJob, start, start_hedge, latencies: _LatencyTracker, total: int) -> str:
+    """
+    Run start(), adding a hedge once it is pending past latencies.hedge_after().
+
+    The hedge point is re-evaluated while the request is in flight, so
+    requests dispatched before enough latencies were observed (the whole
+    first wave) can still be hedged. start_hedge() returns the hedge task, or
+    None without spare capacity, in which case it is retried after another
+    median latency. The first attempt to succeed wins and the other is
+    cancelled; the error is only raised if every attempt fails.
+    """
+    started = time.monotonic()
+    pending = {asyncio.create_task(start())}
+    done = set()
+    ready = asyncio.create_task(latencies.ready.wait())
+    try:
+        while not done:
+            hedge_after = latencies.hedge_after()
+            if hedge_after is None:
+                done, _ = await asyncio.wait(pending | {ready}, return_when=asyncio.FIRST_COMPLETED)
+                done.discard(ready)
+                pending -= done
+                continue
+            elapsed = time.monotonic() - started
+            if elapsed < hedge_after:
+                wait = hedge_after - elapsed
+            else:
+                hedge_task = await start_hedge()
+                if hedge_task is not None:
+                    logger.info(
+                        f"  [{job.index}/{total}] {job.slide_id}: No response after {elapsed:.1f}s, "
+                        f"sending a hedged request"
+                    )
+                    pending.add(hedge_task)
+                    break
+                wait = hedge_after / HEDGE_LATENCY_FACTOR
+            done, pending = await asyncio.wait(pending, timeout=wait)
+    finally:
+        ready.cancel()
+
+    error: Optional[BaseException] = None
+    while True:
+        for task in done:
+            if task.exception() is None:
+                for loser in pending:
+                    loser.cancel()
+                return task.result()
+            error = error or task.exception()
+        if not pending:
+            raise error
+        done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+
+
+def _enhance_sections_batch(to_enhance: List[_SlideJob], style_profile: str) -> int:
+    """
+    Transform the selected sections with a single Batch API job.
+
+    Slides missing from the batch output get the basic fallback narrative.
+
+    Returns:
+        Number of sections enhanced
+    """
+    texts = {_request_id(job): job.structured_text for job in to_enhance}
+    budgets = {
+        _request_id(job): _narrative_token_budget(job.section["speaker_notes"])
+        for job in to_enhance
+    }
+
+    try:
+        narratives = run_style_batch(texts, style_profile, budgets)
+    except Exception as e:
+        logger.warning(f"Batch transformation failed, using fallback: {e}")
+        narratives = {}
+
+    for job in to_enhance:
+        narrative = narratives.get(_request_id(job))
+        if narrative:
+            _apply_narrative(job, narrative, job.fingerprint)
+        else:
+            _apply_narrative(job, _fallback_for(job), None)
+
+    return len(to_enhance)
+
+
+def _request_id(job: _SlideJob) -> str:
+    """Unique id for a slide inside a multi-slide or Batch API request."""
+    return f"{job.index:03d}_{job.slide_id}"
+
+
+def _apply_narrative(job: _SlideJob, narrative: str, fingerprint: Optional[str]):
+    """
+    Store a narrative on its section (structured notes are kept for reference).
+
+    Fallback narratives carry no fingerprint, so the next run retries them.
+    """
+    job.section["speaker_notes_narrative"] = narrative
+    if fingerprint:
+        job.section[FINGERPRINT_KEY] = fingerprint
+    else:
+        job.section.pop(FINGERPRINT_KEY, None)
+
+
+def _build_structured_text(title: str, content: str, speaker_notes: Dict[str, Any]) -> str:
+    """
+    Build the user prompt for the style-replicator agent.
+
+    The static instruction block comes first and per-slide fields last, so
+    every request shares a byte-identical prefix (system prompt + instructions)
+    that provider-side prompt caching can reuse across slides.
     """
-    # Build structured input for transformation
     talking_points = speaker_notes.get("talking_points", [])
     key_terms = speaker_notes.get("key_terms", [])
     transition = speaker_notes.get("transition", "")
     duration = speaker_notes.get("duration_minutes", 2)
 
-    # Create a prompt for the style-replicator agent
-    structured_text = f"""# Speaker Notes for: {title}
+    context = ""
+    if content and _token_overlap(content, " ".join(talking_points)) <= CONTEXT_OVERLAP_THRESHOLD:
+        context = f"""
+## Context (Slide Content):
+{content[:CONTEXT_MAX_CHARS]}
+"""
+
+    return STATIC_USER_PREFIX + f"""# Speaker Notes for: {title}
 
 ## Talking Points:
 {chr(10).join(f'- {point}' for point in talking_points)}
@@ -141,29 +547,96 @@ def _transform_to_narrative(
 
 ## Transition:
 {transition}
+{context}
+## Duration: {duration} minutes
+"""
 
-## Context (Slide Content):
-{content[:500]}
 
-## Duration: {duration} minutes
+def _token_overlap(text: str, reference: str) -> float:
+    """Fraction of the distinct words in text that also appear in reference."""
+    tokens = set(re.findall(r"\w+", text.lower()))
+    if not tokens:
+        return 1.0
+    reference_tokens = set(re.findall(r"\w+", reference.lower()))
+    return len(tokens & reference_tokens) / len(tokens)
 
----
 
-Transform these bullet-point talking points into a complete narrative script that a speaker can read aloud naturally. The script should:
-- Be conversational and engaging
-- Incorporate the key terms naturally
-- Maintain the {duration}-minute duration
-- End with the transition phrase
-- Match the speaker's personal style (informal, direct, uses "here's the thing", parenthetical asides, etc.)
-"""
+async def _atransform_to_narrative(
+    job: _SlideJob,
+    style_profile: str,
+    limiter: Optional[RateLimiter] = None,
+    stream: bool = False,
+    saver: Optional[_CheckpointSaver] = None,
+    on_latency: Optional[Callable[[float], None]] = None,
+) -> str:
+    """
+    Transform a slide's structured speaker notes into narrative form.
+
+    Uses the style-replicator agent to generate a full narrative script
+    from structured talking points. When streaming, each finished sentence
+    is written through to the section (and the saver told about it), so the
+    checkpoint shows the narrative growing before the slide completes.
+
+    Args:
+        job: Slide job holding the prepared prompt
+        style_profile: Style profile name
+        limiter: Optional shared RateLimiter for concurrent calls
+        stream: Use a streamed completion, written through sentence by sentence
+        saver: Optional checkpoint saver flushed as sentences arrive
+        on_latency: Optional callback given each API round-trip's duration
+                    (non-streamed requests only)
+
+    Returns:
+        Narrative speaker notes as a string
 
-    # Invoke LLM-based style transformation
+    Raises:
+        Exception: If the LLM transformation fails (callers apply the fallback)
+    """
+    max_tokens = _narrative_token_budget(job.section["speaker_notes"])
+    if not stream:
+        return await ainvoke_style_replicator(
+            job.structured_text, style_profile, limiter, max_tokens=max_tokens, on_latency=on_latency
+        )
+
+    # A partial narrative must never look up to date
+    _apply_narrative(job, "", None)
+    narrative = ""
+    async for sentence in astream_style_replicator(
+        job.structured_text, style_profile, limiter, max_tokens=max_tokens
+    ):
+        narrative += sentence
+        job.section["speaker_notes_narrative"] = narrative
+        if saver:
+            saver.touch()
+    return narrative
+
+
+def _narrative_token_budget(speaker_notes: Dict[str, Any]) -> int:
+    """
+    Completion budget scaled to the slide's speaking time.
+
+    A one-minute narrative is roughly 180 words (~260 tokens), so a flat
+    DEFAULT_MAX_TOKENS over-reserves for most slides. The budget is
+    duration * TOKENS_PER_MINUTE, clamped to
+    [MIN_NARRATIVE_TOKENS, DEFAULT_MAX_TOKENS].
+    """
     try:
-        narrative = invoke_style_replicator(structured_text, style_profile)
-        return narrative
-    except Exception as e:
-        logger.warning(f"Style transformation failed, using fallback: {e}")
-        return _fallback_narrative(title, talking_points, key_terms, transition, duration)
+        duration = float(speaker_notes.get("duration_minutes", 2))
+    except (TypeError, ValueError):
+        duration = 2
+    return max(MIN_NARRATIVE_TOKENS, min(DEFAULT_MAX_TOKENS, int(duration * TOKENS_PER_MINUTE)))
+
+
+def _fallback_for(job: _SlideJob) -> str:
+    """Basic narrative for a slide whose LLM transformation failed."""
+    notes = job.section["speaker_notes"]
+    return _fallback_narrative(
+        job.section.get("title", ""),
+        notes.get("talking_points", []),
+        notes.get("key_terms", []),
+        notes.get("transition", ""),
+        notes.get("duration_minutes", 2),
+    )
 
 
 def _fallback_narrative(
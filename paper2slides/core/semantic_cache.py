@@ -0,0 +1,156 @@
+"""
+Semantic cache for narrative transformations
+
+Reuses a narrative when a new prompt is a near-duplicate of one already
+transformed (cosine similarity of embeddings above a threshold), catching
+repeats the exact-hash response cache misses. Enabled with
+RAG_LLM_SEMANTIC_CACHE=1.
+
+Entries live in a local SQLite file and are partitioned by namespace (model,
+sampling settings and system prompt), so changing any of those never serves
+a narrative produced under the old settings. Entries also expire with the
+response cache TTL; call clear() after editing a style prompt in place.
+"""
+import contextlib
+import logging
+import math
+import os
+import sqlite3
+import time
+from array import array
+from pathlib import Path
+from typing import Iterator, List, Optional
+
+logger = logging.getLogger(__name__)
+
+EMBEDDING_MODEL = "text-embedding-3-small"
+DEFAULT_THRESHOLD = 0.97  # override with RAG_LLM_SEMANTIC_CACHE_THRESHOLD
+
+# Prompts are "<instructions>\n---\n\n<slide>"; only the slide part is
+# embedded, otherwise the shared instructions make every slide look alike
+PROMPT_SEPARATOR = "\n---\n\n"
+
+_db_path = Path.home() / ".cache" / "paper2slides" / "semantic_cache.sqlite"
+
+
+def enabled() -> bool:
+    return os.getenv("RAG_LLM_SEMANTIC_CACHE", "") == "1"
+
+
+def embedding_input(structured_text: str) -> str:
+    """Return the slide-specific part of a prompt, which is what gets embedded."""
+    _, sep, body = structured_text.partition(PROMPT_SEPARATOR)
+    return body if sep else structured_text
+
+
+def embed(client, structured_text: str) -> Optional[List[float]]:
+    """
+    Embed a prompt with a sync OpenAI client.
+
+    Returns:
+        Unit-length vector, or None if the embedding call fails
+    """
+    try:
+        response = client.embeddings.create(
+            model=EMBEDDING_MODEL, input=embedding_input(structured_text)
+        )
+    except Exception as e:
+        logger.warning(f"Semantic cache embedding failed: {e}")
+        return None
+    return _normalize(response.data[0].embedding)
+
+
+async def aembed(client, structured_text: str) -> Optional[List[float]]:
+    """Async counterpart of embed() for an AsyncOpenAI client."""
+    try:
+        response = await client.embeddings.create(
+            model=EMBEDDING_MODEL, input=embedding_input(structured_text)
+        )
+    except Exception as e:
+        logger.warning(f"Semantic cache embedding failed: {e}")
+        return None
+    return _normalize(response.data[0].embedding)
+
+
+def lookup(namespace: str, vector: List[float], ttl: float) -> Optional[str]:
+    """
+    Return the narrative of the most similar live entry, if above the threshold.
+
+    Args:
+        namespace: Partition key (see agent_integration._semantic_namespace)
+        vector: Unit-length embedding of the new prompt
+        ttl: Maximum entry age in seconds
+
+    Returns:
+        Cached narrative, or None on a miss
+    """
+    threshold = float(os.getenv("RAG_LLM_SEMANTIC_CACHE_THRESHOLD", DEFAULT_THRESHOLD))
+    best_score, best_narrative = -1.0, None
+    try:
+        with _connection() as conn:
+            conn.execute("DELETE FROM entries WHERE created < ?", (time.time() - ttl,))
+            rows = conn.execute(
+                "SELECT vector, narrative FROM entries WHERE namespace = ?", (namespace,)
+            )
+            for blob, narrative in rows:
+                score = sum(a * b for a, b in zip(vector, array("f", blob)))
+                if score > best_score:
+                    best_score, best_narrative = score, narrative
+    except (sqlite3.Error, OSError) as e:
+        logger.warning(f"Semantic cache lookup failed: {e}")
+        return None
+
+    if best_score < threshold:
+        return None
+    logger.info(f"Using semantically cached narrative (similarity {best_score:.3f})")
+    return best_narrative
+
+
+def store(namespace: str, vector: List[float], narrative: str):
+    """Add a narrative to the cache (empty narratives are not stored)."""
+    if not narrative:
+        return
+    try:
+        with _connection() as conn:
+            conn.execute(
+                "INSERT INTO entries (namespace, vector, narrative, created) VALUES (?, ?, ?, ?)",
+                (namespace, array("f", vector).tobytes(), narrative, time.time()),
+            )
+    except (sqlite3.Error, OSError) as e:
+        logger.warning(f"Could not write semantic cache entry: {e}")
+
+
+def clear():
+    """Drop every entry (e.g. after editing a style prompt)."""
+    try:
+        with _connection() as conn:
+            conn.execute("DELETE FROM entries")
+    except (sqlite3.Error, OSError) as e:
+        logger.warning(f"Could not clear semantic cache: {e}")
+
+
+def _normalize(vector: List[float]) -> List[float]:
+    norm = math.sqrt(sum(x * x for x in vector)) or 1.0
+    return [x / norm for x in vector]
+
+
+@contextlib.contextmanager
+def _connection() -> Iterator[sqlite3.Connection]:
+    """
+    Open the cache database, committing on success and always closing.
+
+    Raises sqlite3.Error or OSError (e.g. an unwritable cache directory);
+    callers log both and carry on without the cache.
+    """
+    _db_path.parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(_db_path)
+    try:
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS entries ("
+            "namespace TEXT NOT NULL, vector BLOB NOT NULL, narrative TEXT NOT NULL, created REAL NOT NULL)"
+        )
+        conn.execute("CREATE INDEX IF NOT EXISTS entries_namespace ON entries (namespace)")
+        with conn:
+            yield conn
+    finally:
+        conn.close()
@@ -5,11 +5,14 @@ Supports two modes:
 - "api": Direct API calls to image generation service (default)
 - "prompt": Export prompts for manual generation via web interface
 """
+import asyncio
+import functools
 import logging
+import os
 from pathlib import Path
 from typing import Dict
 
-from ...utils import load_json
+from ...utils import ensure_dir, load_json_cached
 from ..paths import get_summary_checkpoint, get_plan_checkpoint, get_output_dir
 
 logger = logging.getLogger(__name__)
@@ -20,49 +23,37 @@ async def run_generate_stage(base_dir: Path, config_dir: Path, config: Dict) ->
     from paper2slides.summary import PaperContent, GeneralContent, TableInfo, FigureInfo, OriginalElements
     from paper2slides.generator import GenerationConfig, GenerationInput
     from paper2slides.generator.config import OutputType, PosterDensity, SlidesLength, StyleType
-    from paper2slides.generator.content_planner import ContentPlan, Section, TableRef, FigureRef
-    from paper2slides.generator.image_generator import ImageGenerator, save_images_as_pdf, save_images_as_pptx
+    from paper2slides.generator.content_planner import ContentPlan, Section
+    from paper2slides.generator.image_generator import ImageGenerator
     
-    plan_data = load_json(get_plan_checkpoint(config_dir))
-    summary_data = load_json(get_summary_checkpoint(base_dir, config))
+    plan_data = load_json_cached(get_plan_checkpoint(config_dir))
+    summary_data = load_json_cached(get_summary_checkpoint(base_dir, config))
     if not plan_data or not summary_data:
         raise ValueError("Missing checkpoints.")
     
     content_type = plan_data.get("content_type", "paper")
     
+    # Build the indices in one pass over the raw JSON; origin lists share the objects
     origin_data = plan_data["origin"]
+    tables_index = {
+        t["id"]: TableInfo(table_id=t["id"], caption=t.get("caption", ""), html_content=t.get("html", ""))
+        for t in origin_data.get("tables", [])
+    }
+    figures_index = {
+        f["id"]: FigureInfo(figure_id=f["id"], caption=f.get("caption"), image_path=f.get("path", ""))
+        for f in origin_data.get("figures", [])
+    }
     origin = OriginalElements(
-        tables=[TableInfo(
-            table_id=t["id"],
-            caption=t.get("caption", ""),
-            html_content=t.get("html", ""),
-        ) for t in origin_data.get("tables", [])],
-        figures=[FigureInfo(
-            figure_id=f["id"],
-            caption=f.get("caption"),
-            image_path=f.get("path", ""),
-        ) for f in origin_data.get("figures", [])],
+        tables=list(tables_index.values()),
+        figures=list(figures_index.values()),
         base_path=origin_data.get("base_path", ""),
     )
     
     plan_dict = plan_data["plan"]
-    tables_index = {t.table_id: t for t in origin.tables}
-    figures_index = {f.figure_id: f for f in origin.figures}
-    
-    sections = []
-    for s in plan_dict.get("sections", []):
-        sections.append(Section(
-            id=s.get("id", ""),
-            title=s.get("title", ""),
-            section_type=s.get("type", "content"),
-            content=s.get("content", ""),
-            tables=[TableRef(**t) for t in s.get("tables", [])],
-            figures=[FigureRef(**f) for f in s.get("figures", [])],
-        ))
     
     plan = ContentPlan(
         output_type=plan_dict.get("output_type", "slides"),
-        sections=sections,
+        sections=[Section.from_dict(s) for s in plan_dict.get("sections", [])],
         tables_index=tables_index,
         figures_index=figures_index,
         metadata=plan_dict.get("metadata", {}),
@@ -79,6 +70,7 @@ async def run_generate_stage(base_dir: Path, config_dir: Path, config: Dict) ->
         slides_length=SlidesLength(config.get("slides_length", "medium")),
         style=StyleType(config.get("style", "academic")),
         custom_style=config.get("custom_style"),
+        batch_size=config.get("batch_size", 1),
     )
     gen_input = GenerationInput(config=gen_config, content=content, origin=origin)
     
@@ -93,31 +85,86 @@ async def run_generate_stage(base_dir: Path, config_dir: Path, config: Dict) ->
 
     # Prepare output directory
     output_subdir = get_output_dir(config_dir)
-    output_subdir.mkdir(parents=True, exist_ok=True)
+    ensure_dir(output_subdir)
     ext_map = {"image/png": ".png", "image/jpeg": ".jpg", "image/webp": ".webp"}
 
     # Prepare prompt output directory for export mode
     prompt_output_dir = output_subdir / "prompts" if export_prompts else None
 
-    # Save callback: save each image immediately after generation
+    # Save each image as soon as it is generated; writes run in worker threads
+    # so disk I/O overlaps with the next API call. The prompt-export generator
+    # runs in a thread itself and hands its saves to the event loop.
+    loop = asyncio.get_running_loop()
+    pending_saves = []
+    log_saves = not export_prompts and logger.isEnabledFor(logging.INFO)
+
+    @functools.lru_cache(maxsize=None)
+    def resolve_path(section_id: str, mime_type: str) -> Path:
+        return output_subdir / f"{section_id}{ext_map.get(mime_type, '.png')}"
+
+    fds = {}
+    written = set()
+
+    def write_file(filepath: Path, data: bytes):
+        fd = fds.get(filepath)
+        if fd is None:
+            filepath.write_bytes(data)
+        else:
+            os.pwrite(fd, data, 0)
+            os.ftruncate(fd, len(data))
+        written.add(filepath)
+
+    async def save_image(img, index, total):
+        filepath = resolve_path(img.section_id, img.mime_type)
+        await asyncio.to_thread(write_file, filepath, img.image_data)
+        if log_saves:
+            logger.info("  [%d/%d] Saved: %s", index + 1, total, filepath.name)
+
     def save_image_callback(img, index, total):
-        ext = ext_map.get(img.mime_type, ".png")
-        filepath = output_subdir / f"{img.section_id}{ext}"
-        with open(filepath, "wb") as f:
-            f.write(img.image_data)
-        if not export_prompts:
-            logger.info(f"  [{index+1}/{total}] Saved: {filepath.name}")
+        pending_saves.append(asyncio.run_coroutine_threadsafe(save_image(img, index, total), loop))
 
     # Create generator with appropriate mode
     generator = ImageGenerator(
         mode="prompt" if export_prompts else "api",
         prompt_output_dir=str(prompt_output_dir) if prompt_output_dir else None,
     )
-    max_workers = config.get("max_workers", 1)
-    images = generator.generate(plan, gen_input, max_workers=max_workers, save_callback=save_image_callback)
+    output_type = config.get("output_type", "slides")
+    if export_prompts:
+        try:
+            # Every target is known up front: open them all once and overwrite
+            # in place (placeholders are PNG) instead of an openat() per save
+            if hasattr(os, "pwrite") and plan.output_type == "slides":
+                for section in plan.sections:
+                    filepath = resolve_path(section.id, "image/png")
+                    fds[filepath] = os.open(filepath, os.O_WRONLY | os.O_CREAT, 0o644)
+            images = await asyncio.to_thread(generator.generate, plan, gen_input, save_callback=save_image_callback)
+            await asyncio.gather(*(asyncio.wrap_future(f) for f in pending_saves))
+        finally:
+            # Let scheduled saves settle before their fds are closed (and the
+            # numbers possibly reused) or their files unlinked
+            await asyncio.gather(*(asyncio.wrap_future(f) for f in pending_saves), return_exceptions=True)
+            for filepath, fd in fds.items():
+                os.close(fd)
+                if filepath not in written:
+                    filepath.unlink(missing_ok=True)
+        num_images = len(images)
+    else:
+        # "max_workers" is the pre-async name of this knob (older state.json files)
+        max_concurrent = config.get("max_concurrent", config.get("max_workers", 1))
+        # Image bytes are only kept when they go into a PDF/PPTX afterwards
+        keep_images = output_type == "slides" and len(plan.sections) > 1
+        by_index = {}
+        saves = []
+        async for index, total, img in generator.agenerate_iter(plan, gen_input, max_concurrent=max_concurrent):
+            saves.append(asyncio.create_task(save_image(img, index, total)))
+            if keep_images:
+                by_index[index] = img
+        await asyncio.gather(*saves)
+        num_images = len(saves)
+        images = [by_index[i] for i in sorted(by_index)]
 
     if export_prompts:
-        logger.info(f"  Exported {len(images)} prompt files")
+        logger.info(f"  Exported {num_images} prompt files")
         logger.info("")
         logger.info(f"Prompts exported to: {prompt_output_dir}")
         logger.info("")
@@ -126,18 +173,19 @@ async def run_generate_stage(base_dir: Path, config_dir: Path, config: Dict) ->
         logger.info("  2. Generate images manually via Nano Banana Pro Chat")
         logger.info("  3. Save generated images as slide_XX_images/generated.png")
         logger.info(f"  4. Run: python -m paper2slides --import-images {prompt_output_dir}")
-        return {"output_dir": str(output_subdir), "num_images": len(images), "prompt_export": True}
+        return {"output_dir": str(output_subdir), "num_images": num_images, "prompt_export": True}
 
-    logger.info(f"  Generated {len(images)} images")
+    logger.info(f"  Generated {num_images} images")
 
     # Generate output file (PPTX or PDF)
-    output_type = config.get("output_type", "slides")
     if output_type == "slides" and len(images) > 1:
         if use_pptx:
+            from paper2slides.generator.image_generator import save_images_as_pptx
             pptx_path = output_subdir / "slides.pptx"
             save_images_as_pptx(images, str(pptx_path))
             logger.info("  Saved: slides.pptx")
         else:
+            from paper2slides.generator.image_generator import save_images_as_pdf
             pdf_path = output_subdir / "slides.pdf"
             save_images_as_pdf(images, str(pdf_path))
             logger.info("  Saved: slides.pdf")
@@ -145,5 +193,5 @@ async def run_generate_stage(base_dir: Path, config_dir: Path, config: Dict) ->
     logger.info("")
     logger.info(f"Output: {output_subdir}")
 
-    return {"output_dir": str(output_subdir), "num_images": len(images)}
+    return {"output_dir": str(output_subdir), "num_images": num_images}
 
@@ -74,8 +74,6 @@ async def run_plan_stage(base_dir: Path, config_dir: Path, config: Dict) -> Dict
     }
     
     checkpoint_path = get_plan_checkpoint(config_dir)
-    checkpoint_path.parent.mkdir(parents=True, exist_ok=True)
-    
     save_json(checkpoint_path, result)
     logger.info(f"  Saved: {checkpoint_path}")
     return result
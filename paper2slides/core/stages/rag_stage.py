@@ -406,10 +406,8 @@ async def run_rag_stage(base_dir: Path, config: Dict) -> Dict:
         "mode": "fast" if fast_mode else "normal",
     }
     
-    # Ensure mode directory exists
+    # save_json creates the mode directory
     checkpoint_path = get_rag_checkpoint(base_dir, config)
-    checkpoint_path.parent.mkdir(parents=True, exist_ok=True)
-    
     save_json(checkpoint_path, result)
     logger.info(f"  Saved: {checkpoint_path}")
     return result
@@ -125,8 +125,6 @@ async def run_summary_stage(base_dir: Path, config: Dict) -> Dict:
     }
     
     checkpoint_path = get_summary_checkpoint(base_dir, config)
-    checkpoint_path.parent.mkdir(parents=True, exist_ok=True)
-    
     save_json(checkpoint_path, result)
     logger.info(f"  Saved: {checkpoint_path}")
     return result
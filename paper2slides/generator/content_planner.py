@@ -6,7 +6,7 @@ import base64
 import re
 from pathlib import Path
 from dataclasses import dataclass, field
-from typing import List, Dict, Any
+from typing import List, Dict, Any, NamedTuple
 from openai import OpenAI
 
 from .config import GenerationInput, OutputType
@@ -21,17 +21,15 @@ from ..prompts.content_planning import (
 )
 
 
-@dataclass
-class TableRef:
-    """Table reference for a section."""
+class TableRef(NamedTuple):
+    """Table reference for a section (immutable)."""
     table_id: str           # e.g., "Table 1"
     extract: str = ""       # Optional: which part to show, html content
     focus: str = ""         # Optional: what aspect to emphasize
 
 
-@dataclass
-class FigureRef:
-    """Figure reference for a section."""
+class FigureRef(NamedTuple):
+    """Figure reference for a section (immutable)."""
     figure_id: str          # e.g., "Figure 1"
     focus: str = ""         # Optional: what to emphasize, description of the figure
 
@@ -52,6 +50,15 @@ class SpeakerNotes:
             "key_terms": self.key_terms,
         }
 
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "SpeakerNotes":
+        return cls(
+            talking_points=data.get("talking_points", []),
+            transition=data.get("transition", ""),
+            duration_minutes=data.get("duration_minutes", 2),
+            key_terms=data.get("key_terms", []),
+        )
+
 
 @dataclass
 class Section:
@@ -96,6 +103,25 @@ class Section:
 
         return result
 
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "Section":
+        """Rebuild a Section from its to_dict() form (e.g. checkpoint_plan.json)."""
+        return cls(
+            id=data.get("id", ""),
+            title=data.get("title", ""),
+            section_type=data.get("type", "content"),
+            content=data.get("content", ""),
+            tables=[
+                TableRef(t.get("table_id", ""), t.get("extract", ""), t.get("focus", ""))
+                for t in data.get("tables", [])
+            ],
+            figures=[
+                FigureRef(f.get("figure_id", ""), f.get("focus", ""))
+                for f in data.get("figures", [])
+            ],
+            speaker_notes=SpeakerNotes.from_dict(data.get("speaker_notes") or {}),
+        )
+
 
 @dataclass
 class ContentPlan:
@@ -416,15 +442,6 @@ class ContentPlanner:
                 else:
                     section_type = "content"
 
-                # Parse speaker notes if present
-                speaker_notes_data = item.get("speaker_notes", {})
-                speaker_notes = SpeakerNotes(
-                    talking_points=speaker_notes_data.get("talking_points", []),
-                    transition=speaker_notes_data.get("transition", ""),
-                    duration_minutes=speaker_notes_data.get("duration_minutes", 2),
-                    key_terms=speaker_notes_data.get("key_terms", []),
-                )
-
                 sections.append(Section(
                     id=item.get("id", f"section_{idx+1}"),
                     title=item.get("title", ""),
@@ -432,7 +449,7 @@ class ContentPlanner:
                     content=item.get("content", ""),
                     tables=tables,
                     figures=figures,
-                    speaker_notes=speaker_notes,
+                    speaker_notes=SpeakerNotes.from_dict(item.get("speaker_notes") or {}),
                 ))
             return sections
             
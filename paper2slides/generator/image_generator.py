@@ -7,17 +7,45 @@ Supports two modes:
 - "prompt": Export prompts for manual generation via web interface
 """
 import os
-import json
-import base64
+import re
 import time
+import base64
+import hashlib
+import asyncio
 import logging
-from dataclasses import dataclass
+import contextlib
+import importlib.util
+from dataclasses import asdict, dataclass
 from pathlib import Path
-from typing import List, Optional, Tuple
-from openai import OpenAI
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import AsyncIterator, Dict, Iterator, List, Optional, Tuple
+import orjson
+from openai import (
+    DEFAULT_CONNECTION_LIMITS,
+    APIConnectionError,
+    APITimeoutError,
+    AsyncOpenAI,
+    DefaultAsyncHttpxClient,
+    OpenAI,
+    RateLimitError,
+)
+from concurrent.futures import ThreadPoolExecutor
 from PIL import Image, ImageDraw, ImageFont
 import io
+import shutil
+import threading
+import zipfile
+import functools
+from collections import deque
+from types import MappingProxyType
+
+try:
+    import pybase64 as b64  # SIMD-accelerated, same API as base64
+    b64encode_str = b64.b64encode_as_string
+except ImportError:
+    b64 = base64
+
+    def b64encode_str(data: bytes) -> str:
+        return base64.b64encode(data).decode("ascii")
 
 # Constants for placeholder images
 PLACEHOLDER_BG_COLOR = '#F3F4F6'  # Light gray background
@@ -27,10 +55,22 @@ PLACEHOLDER_TEXT_COLOR = '#1F2937'  # Dark gray text
 PLACEHOLDER_WIDTH = 1920
 PLACEHOLDER_HEIGHT = 1080
 PLACEHOLDER_BORDER_WIDTH = 4
+PLACEHOLDER_PNG_COMPRESS_LEVEL = 1  # flat-color image: fast zlib, still small (~50KB)
+
+# Default cap on in-flight image generation requests in async API mode
+DEFAULT_MAX_CONCURRENT = 5
+
+# Signatures of the image types img2pdf can embed in a PDF without re-encoding
+# (sniffed from the bytes; the reported mime type is not always accurate)
+PDF_DIRECT_SIGNATURES = (b'\x89PNG\r\n\x1a\n', b'\xff\xd8\xff')
+# Pages decoded ahead of the one being written when PIL builds the PDF (one
+# thread each): scales with cores, capped so a large deck stays bounded in memory
+PDF_DECODE_AHEAD = max(2, min(8, os.cpu_count() or 1))
 
 # Filename constants
 GENERATED_IMAGE_FILENAME = 'generated.png'
 SLIDE_DIR_TEMPLATE = 'slide_{:02d}_images'
+SLIDE_DIR_PATTERN = re.compile(r'slide_(\d+)_images')  # matches SLIDE_DIR_TEMPLATE names
 SLIDE_PROMPT_TEMPLATE = 'slide_{:02d}_prompt.txt'
 INSTRUCTIONS_FILENAME = 'INSTRUCTIONS.md'
 
@@ -43,8 +83,30 @@ IMPORT_ALTERNATIVE_FILENAMES = [
     'output.png',
 ]
 
+# Figure file types by extension (anything else is sent as JPEG)
+FIGURE_MIME_TYPES = {
+    ".jpg": "image/jpeg", ".jpeg": "image/jpeg",
+    ".png": "image/png", ".webp": "image/webp", ".gif": "image/gif"
+}
+FIGURE_LOAD_WORKERS = 16
+
+# Retries: any failed image call is retried IMAGE_MAX_RETRIES times in total;
+# rate limits, timeouts and dropped connections get TRANSIENT_MAX_RETRIES
+IMAGE_MAX_RETRIES = 3
+TRANSIENT_MAX_RETRIES = 5
+TRANSIENT_ERRORS = (RateLimitError, APITimeoutError, APIConnectionError)
+RETRY_BASE_DELAY = 1.0  # seconds, lower bound of the decorrelated jitter
+RETRY_MAX_DELAY = 60.0  # seconds, also caps a server's Retry-After
+
+# On-disk cache of processed custom styles (enabled with RAG_LLM_CACHE=1)
+_style_cache_dir = Path.home() / ".cache" / "paper2slides" / "style"
+DEFAULT_STYLE_CACHE_TTL = 7 * 24 * 3600  # seconds, override with RAG_LLM_CACHE_TTL
+
+# Threads writing prompt files and reference images in prompt export mode
+PROMPT_EXPORT_IO_WORKERS = 4
+
 # Cross-platform font paths (tried in order)
-FONT_PATHS_BOLD = [
+FONT_PATHS_BOLD = (
     # Linux
     '/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf',
     '/usr/share/fonts/TTF/DejaVuSans-Bold.ttf',
@@ -54,8 +116,8 @@ FONT_PATHS_BOLD = [
     # Windows
     'C:/Windows/Fonts/arialbd.ttf',
     'C:/Windows/Fonts/segoeui.ttf',
-]
-FONT_PATHS_REGULAR = [
+)
+FONT_PATHS_REGULAR = (
     # Linux
     '/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf',
     '/usr/share/fonts/TTF/DejaVuSans.ttf',
@@ -65,11 +127,12 @@ FONT_PATHS_REGULAR = [
     # Windows
     'C:/Windows/Fonts/arial.ttf',
     'C:/Windows/Fonts/segoeui.ttf',
-]
+)
 
 
-def _load_font(font_paths: list, size: int):
-    """Load font from first available path, fallback to default."""
+@functools.lru_cache(maxsize=None)
+def _load_font(font_paths: tuple, size: int):
+    """Load font from first available path, fallback to default (cached per path list and size)."""
     for path in font_paths:
         try:
             return ImageFont.truetype(path, size)
@@ -78,6 +141,65 @@ def _load_font(font_paths: list, size: int):
     return ImageFont.load_default()
 
 
+def _placeholder_lines(slide_num: int, title: str, static: bool) -> list:
+    """
+    Placeholder text lines, top to bottom.
+
+    static=True gives the lines shared by every slide, static=False the
+    per-slide ones; the other kind is None, so both layers keep the layout.
+    """
+    slide_dir = SLIDE_DIR_TEMPLATE.format(slide_num)
+    # (is_static, text); None is a blank line
+    lines = [
+        (False, f"SLIDE {slide_num:02d}"),
+        None,
+        (True, "Placeholder Image"),
+        None,
+        (True, "Generate this slide manually using:"),
+        (False, SLIDE_PROMPT_TEMPLATE.format(slide_num)),
+        None,
+        (True, "Then place the generated image as:"),
+        (False, f"{slide_dir}/{GENERATED_IMAGE_FILENAME}"),
+    ]
+    if title:
+        lines.insert(1, (False, f"({title})"))
+    return [line[1] if line and line[0] == static else None for line in lines]
+
+
+def _draw_placeholder_lines(draw: ImageDraw.ImageDraw, text_lines: list):
+    """Draw centered text lines, leaving a gap for None (first line is the large title)."""
+    font_large = _load_font(FONT_PATHS_BOLD, 48)
+    font_medium = _load_font(FONT_PATHS_REGULAR, 32)
+
+    y_position = 200
+    for i, line in enumerate(text_lines):
+        if line:
+            font = font_large if i == 0 else font_medium
+            color = PLACEHOLDER_TITLE_COLOR if i == 0 else PLACEHOLDER_TEXT_COLOR
+            bbox = draw.textbbox((0, 0), line, font=font)
+            text_width = bbox[2] - bbox[0]
+            x = (PLACEHOLDER_WIDTH - text_width) // 2
+            draw.text((x, y_position), line, fill=color, font=font)
+        y_position += 60 if i == 0 else 45
+
+
+@functools.lru_cache(maxsize=2)
+def _placeholder_template(has_title: bool) -> Image.Image:
+    """16:9 placeholder background, border and static text (copy before drawing on it)."""
+    img = Image.new('RGB', (PLACEHOLDER_WIDTH, PLACEHOLDER_HEIGHT), color=PLACEHOLDER_BG_COLOR)
+    draw = ImageDraw.Draw(img)
+    draw.rectangle(
+        [10, 10, PLACEHOLDER_WIDTH - 10, PLACEHOLDER_HEIGHT - 10],
+        outline=PLACEHOLDER_BORDER_COLOR,
+        width=PLACEHOLDER_BORDER_WIDTH,
+    )
+    # A title line shifts the static lines down, hence one template per case
+    _draw_placeholder_lines(draw, _placeholder_lines(0, "title" if has_title else "", static=True))
+    return img
+
+
+from ..utils import decode_json
+from ..utils.rate_limit import RateLimiter, retry
 from .config import GenerationInput
 from .content_planner import ContentPlan, Section
 from ..prompts.image_generation import (
@@ -106,7 +228,7 @@ class GeneratedImage:
     mime_type: str
 
 
-@dataclass
+@dataclass(frozen=True)
 class ProcessedStyle:
     """Processed custom style from LLM."""
     style_name: str       # e.g., "Cyberpunk sci-fi style with high-tech aesthetic"
@@ -118,17 +240,23 @@ class ProcessedStyle:
 
 
 def process_custom_style(client: OpenAI, user_style: str, model: str = None) -> ProcessedStyle:
-    """Process user's custom style request with LLM."""
+    """
+    Process user's custom style request with LLM.
+
+    With RAG_LLM_CACHE=1, valid results are cached on disk (same TTL as the
+    narrative cache), so regenerating with the same style skips the call.
+    """
     model = model or os.getenv("LLM_MODEL", "openai/gpt-4o-mini")
+    prompt = STYLE_PROCESS_PROMPT.format(user_style=user_style)
+    cache_key = hashlib.sha256(f"{model}|{prompt}".encode("utf-8")).hexdigest()
+    cached = _style_cache_get(cache_key)
+    if cached:
+        return cached
     
     try:
-        response = client.chat.completions.create(
-            model=model,
-            messages=[{"role": "user", "content": STYLE_PROCESS_PROMPT.format(user_style=user_style)}],
-            response_format={"type": "json_object"},
-        )
-        result = json.loads(response.choices[0].message.content)
-        return ProcessedStyle(
+        response = _create_style_completion(client, model, prompt)
+        result = orjson.loads(response.choices[0].message.content)
+        processed = ProcessedStyle(
             style_name=result.get("style_name", ""),
             color_tone=result.get("color_tone", ""),
             special_elements=result.get("special_elements", ""),
@@ -138,6 +266,51 @@ def process_custom_style(client: OpenAI, user_style: str, model: str = None) ->
         )
     except Exception as e:
         return ProcessedStyle(style_name="", color_tone="", special_elements="", decorations="", valid=False, error=str(e))
+    
+    if processed.valid:
+        _style_cache_put(cache_key, processed)
+    return processed
+
+
+@retry(1, TRANSIENT_ERRORS, TRANSIENT_MAX_RETRIES, RETRY_BASE_DELAY, RETRY_MAX_DELAY)
+def _create_style_completion(client: OpenAI, model: str, prompt: str):
+    """Style-processing completion; only transient errors are retried."""
+    return client.chat.completions.create(
+        model=model,
+        messages=[{"role": "user", "content": prompt}],
+        response_format={"type": "json_object"},
+    )
+
+
+def _style_cache_enabled() -> bool:
+    return os.getenv("RAG_LLM_CACHE", "") == "1"
+
+
+def _style_cache_get(key: str) -> Optional[ProcessedStyle]:
+    """Return a cached processed style if present and younger than the TTL."""
+    if not _style_cache_enabled():
+        return None
+    cache_file = _style_cache_dir / f"{key}.json"
+    ttl = float(os.getenv("RAG_LLM_CACHE_TTL", DEFAULT_STYLE_CACHE_TTL))
+    try:
+        if time.time() - cache_file.stat().st_mtime > ttl:
+            return None
+        processed = ProcessedStyle(**orjson.loads(cache_file.read_bytes()))
+    except (OSError, ValueError, TypeError):
+        return None
+    logging.getLogger(__name__).info(f"Using cached custom style: {processed.style_name}")
+    return processed
+
+
+def _style_cache_put(key: str, processed: ProcessedStyle):
+    """Store a processed style in the cache (no-op when disabled)."""
+    if not _style_cache_enabled():
+        return
+    try:
+        _style_cache_dir.mkdir(parents=True, exist_ok=True)
+        (_style_cache_dir / f"{key}.json").write_bytes(orjson.dumps(asdict(processed)))
+    except OSError as e:
+        logging.getLogger(__name__).warning(f"Could not write style cache entry: {e}")
 
 
 class ImageGenerator:
@@ -155,18 +328,25 @@ class ImageGenerator:
         model: str = "google/gemini-3-pro-image-preview",
         mode: str = "api",
         prompt_output_dir: Optional[str] = None,
+        max_rpm: Optional[float] = None,
     ):
         self.mode = mode
         self.prompt_output_dir = Path(prompt_output_dir) if prompt_output_dir else None
         self.api_key = api_key or os.getenv("IMAGE_GEN_API_KEY", "")
         self.base_url = base_url or os.getenv("IMAGE_GEN_BASE_URL", "https://openrouter.ai/api/v1")
         self.model = model
+        # Provider requests/minute cap (IMAGE_GEN_MAX_RPM); None leaves only the concurrency bound
+        rpm = os.getenv("IMAGE_GEN_MAX_RPM", "").strip()
+        self.max_rpm = max_rpm if max_rpm is not None else (float(rpm) if rpm else None)
 
         # Initialize image generation client (only in API mode)
         if self.mode == "api":
             self.client = OpenAI(api_key=self.api_key, base_url=self.base_url)
         else:
             self.client = None
+        # AsyncOpenAI client and request limiter, created for the duration of agenerate()
+        self.async_client: Optional[AsyncOpenAI] = None
+        self._rate_limiter: Optional[RateLimiter] = None
 
         # Initialize LLM client for style processing (needed in both modes for custom styles)
         # Uses RAG_LLM_API_KEY which is typically an OpenAI key
@@ -177,6 +357,20 @@ class ImageGenerator:
         else:
             self.llm_client = None
 
+        # Per-section markdown of the plan being generated, rendered once in _prepare()
+        self._section_mds: List[str] = []
+        # Reference figures of each section, aligned with plan.sections (set in _prepare())
+        self._section_images: List[tuple] = []
+        # Slide-independent prompt head and the (style, processed style, context) it was built for
+        self._slide_prefix_key: Optional[tuple] = None
+        self._slide_prefix = ""
+
+        # Figure file contents of the current run, keyed on (path, mtime_ns, size)
+        # so figures sharing a file are read once; emptied when the run ends
+        self._file_cache: Dict[tuple, bytes] = {}
+        # Inline image message parts of the current run, keyed on (mime type, bytes)
+        self._image_parts: Dict[tuple, dict] = {}
+
         # Track exported prompts for reference chain
         self._exported_prompts: List[dict] = []
         self._slide_counter = 0
@@ -194,13 +388,130 @@ class ImageGenerator:
         Args:
             plan: ContentPlan from ContentPlanner
             gen_input: GenerationInput with config and origin
-            max_workers: Maximum parallel workers for slides (3rd+ slides run in parallel)
+            max_workers: Maximum in-flight image requests in API mode (3rd+ slides run concurrently)
             save_callback: Optional callback function(generated_image, index, total) called after each image
         
         Returns:
             List of GeneratedImage (1 for poster, N for slides)
         """
+        if self.mode == "api":
+            # API calls are async; drive them on a private event loop (use
+            # agenerate() directly when an event loop is already running)
+            return asyncio.run(self.agenerate(
+                plan, gen_input, max_concurrent=max_workers, save_callback=save_callback
+            ))
+
+        if plan.output_type == "poster":
+            # Prompt export mode doesn't support posters (only slides workflow)
+            raise ValueError(
+                "Prompt export mode only supports slides output. "
+                "Use --output slides with --export-prompts."
+            )
+        try:
+            figure_images, style_name, processed_style, all_sections_md = self._prepare(plan, gen_input)
+            return self._generate_slides_prompt_mode(
+                plan, style_name, processed_style, all_sections_md, figure_images,
+                self._select_layouts(style_name), save_callback,
+            )
+        finally:
+            self._clear_run_caches()
+
+    async def agenerate(
+        self,
+        plan: ContentPlan,
+        gen_input: GenerationInput,
+        max_concurrent: int = DEFAULT_MAX_CONCURRENT,
+        save_callback = None,
+    ) -> List[GeneratedImage]:
+        """
+        Generate images from ContentPlan with async API calls (API mode only).
+
+        The first two slides are generated in order (slide 2 becomes the style
+        reference); slides from the 3rd onwards are requested concurrently
+        through a shared AsyncOpenAI connection pool, bounded by a semaphore.
+
+        Args:
+            plan: ContentPlan from ContentPlanner
+            gen_input: GenerationInput with config and origin
+            max_concurrent: Maximum in-flight image requests (3rd+ slides)
+            save_callback: Optional callback function(generated_image, index, total) called after each image
+
+        Returns:
+            List of GeneratedImage (1 for poster, N for slides)
+        """
+        if self.mode != "api":
+            raise ValueError("agenerate() requires API mode; use generate() to export prompts.")
+
+        try:
+            figure_images, style_name, processed_style, all_sections_md = await asyncio.to_thread(
+                self._prepare, plan, gen_input
+            )
+            self.async_client = AsyncOpenAI(
+                api_key=self.api_key,
+                base_url=self.base_url,
+                http_client=_image_http_client(max_concurrent),
+            )
+            self._rate_limiter = RateLimiter(max_requests_per_minute=self.max_rpm) if self.max_rpm else None
+            if plan.output_type == "poster":
+                prompt = self._build_poster_prompt(
+                    format_prefix=FORMAT_POSTER,
+                    style_name=style_name,
+                    processed_style=processed_style,
+                    sections_md=all_sections_md,
+                )
+                image_data, mime_type = await self._acall_model(
+                    prompt, self._filter_images(plan.sections, figure_images)
+                )
+                result = [GeneratedImage(section_id="poster", image_data=image_data, mime_type=mime_type)]
+                if save_callback:
+                    save_callback(result[0], 0, 1)
+                return result
+            return await self._agenerate_slides_api_mode(
+                plan, style_name, processed_style, all_sections_md, figure_images,
+                self._select_layouts(style_name), max_concurrent, save_callback,
+                batch_size=gen_input.config.batch_size,
+            )
+        finally:
+            if self.async_client is not None:
+                await self.async_client.close()
+            self.async_client = None
+            self._rate_limiter = None
+            self._clear_run_caches()
+
+    def _clear_run_caches(self):
+        """Drop per-run cached file contents and data URLs so they don't outlive the job."""
+        self._file_cache.clear()
+        self._image_parts.clear()
+
+    async def agenerate_iter(
+        self,
+        plan: ContentPlan,
+        gen_input: GenerationInput,
+        max_concurrent: int = DEFAULT_MAX_CONCURRENT,
+    ) -> AsyncIterator[Tuple[int, int, GeneratedImage]]:
+        """
+        Like agenerate(), but yield (index, total, image) as each image completes.
+
+        Images arrive in completion order, not slide order, so callers can
+        save each one right away and decide which ones to keep in memory.
+        """
+        queue: asyncio.Queue = asyncio.Queue()
+        task = asyncio.create_task(self.agenerate(
+            plan, gen_input, max_concurrent,
+            save_callback=lambda img, index, total: queue.put_nowait((index, total, img)),
+        ))
+        task.add_done_callback(lambda _: queue.put_nowait(None))
+        try:
+            while (item := await queue.get()) is not None:
+                yield item
+            task.result()  # re-raise generation errors
+        finally:
+            task.cancel()
+
+    def _prepare(self, plan: ContentPlan, gen_input: GenerationInput) -> tuple:
+        """Load figures, resolve the style and format the deck-wide markdown context."""
         figure_images = self._load_figure_images(plan, gen_input.origin.base_path)
+        self._section_images = self._index_section_images(plan.sections, figure_images)
         style_name = gen_input.config.style.value
         custom_style = gen_input.config.custom_style
         
@@ -219,57 +530,15 @@ class ImageGenerator:
                 raise ValueError(f"Invalid custom style: {processed_style.error}")
         
         all_sections_md = self._format_sections_markdown(plan)
-        all_images = self._filter_images(plan.sections, figure_images)
-        
-        if plan.output_type == "poster":
-            # Prompt export mode doesn't support posters (only slides workflow)
-            if self.mode == "prompt":
-                raise ValueError(
-                    "Prompt export mode only supports slides output. "
-                    "Use --output slides with --export-prompts."
-                )
-            result = self._generate_poster(style_name, processed_style, all_sections_md, all_images)
-            if save_callback and result:
-                save_callback(result[0], 0, 1)
-            return result
-        else:
-            return self._generate_slides(plan, style_name, processed_style, all_sections_md, figure_images, max_workers, save_callback)
-    
-    def _generate_poster(self, style_name, processed_style: Optional[ProcessedStyle], sections_md, images) -> List[GeneratedImage]:
-        """Generate 1 poster image."""
-        prompt = self._build_poster_prompt(
-            format_prefix=FORMAT_POSTER,
-            style_name=style_name,
-            processed_style=processed_style,
-            sections_md=sections_md,
-        )
-        
-        image_data, mime_type = self._call_model(prompt, images)
-        return [GeneratedImage(section_id="poster", image_data=image_data, mime_type=mime_type)]
-    
-    def _generate_slides(self, plan, style_name, processed_style: Optional[ProcessedStyle], all_sections_md, figure_images, max_workers: int, save_callback=None) -> List[GeneratedImage]:
-        """Generate N slide images.
+        return figure_images, style_name, processed_style, all_sections_md
 
-        Dispatches to mode-specific implementation:
-        - prompt mode: Sequential export for manual generation
-        - api mode: First 2 sequential, rest parallel for efficiency
-        """
-        # Select layout rules based on style
+    def _select_layouts(self, style_name: str) -> dict:
+        """Select layout rules based on style."""
         if style_name == "custom":
-            layouts = SLIDE_LAYOUTS_DEFAULT
+            return SLIDE_LAYOUTS_DEFAULT
         elif style_name == "doraemon":
-            layouts = SLIDE_LAYOUTS_DORAEMON
-        else:
-            layouts = SLIDE_LAYOUTS_ACADEMIC
-
-        if self.mode == "prompt":
-            return self._generate_slides_prompt_mode(
-                plan, style_name, processed_style, all_sections_md, figure_images, layouts, save_callback
-            )
-        else:
-            return self._generate_slides_api_mode(
-                plan, style_name, processed_style, all_sections_md, figure_images, layouts, max_workers, save_callback
-            )
+            return SLIDE_LAYOUTS_DORAEMON
+        return SLIDE_LAYOUTS_ACADEMIC
 
     def _generate_slides_prompt_mode(
         self,
@@ -281,47 +550,61 @@ class ImageGenerator:
         layouts,
         save_callback=None,
     ) -> List[GeneratedImage]:
-        """Generate slides in prompt export mode (sequential, for manual generation)."""
+        """
+        Generate slides in prompt export mode (sequential, for manual generation).
+
+        Prompt and reference-image files are written by a small thread pool,
+        so disk I/O overlaps with building the next slide's prompt.
+        """
         results = []
         total = len(plan.sections)
+        pending_writes = []
 
-        for i in range(total):
-            section = plan.sections[i]
-            section_md = self._format_single_section_markdown(section, plan)
-            layout_rule = layouts.get(section.section_type, layouts["content"])
+        with ThreadPoolExecutor(max_workers=PROMPT_EXPORT_IO_WORKERS) as io_pool:
+            def submit(fn, *args):
+                pending_writes.append(io_pool.submit(fn, *args))
 
-            prompt = self._build_slide_prompt(
-                style_name=style_name,
-                processed_style=processed_style,
-                sections_md=section_md,
-                layout_rule=layout_rule,
-                slide_info=f"Slide {i+1} of {total}",
-                context_md=all_sections_md,
-            )
+            for i in range(total):
+                section = plan.sections[i]
+                section_md = self._section_mds[i]
+                layout_rule = layouts.get(section.section_type, layouts["content"])
 
-            section_images = self._filter_images([section], figure_images)
+                prompt = self._build_slide_prompt(
+                    style_name=style_name,
+                    processed_style=processed_style,
+                    sections_md=section_md,
+                    layout_rule=layout_rule,
+                    slide_info=f"Slide {i+1} of {total}",
+                    context_md=all_sections_md,
+                )
 
-            # Export prompt with reference chain instructions
-            image_data, mime_type = self._export_prompt(
-                prompt=prompt,
-                reference_images=section_images,
-                slide_num=i + 1,
-                total_slides=total,
-                section_title=section.title,
-            )
+                section_images = self._section_images[i]
 
-            generated_img = GeneratedImage(section_id=section.id, image_data=image_data, mime_type=mime_type)
-            results.append(generated_img)
+                # Export prompt with reference chain instructions
+                image_data, mime_type = self._export_prompt(
+                    prompt=prompt,
+                    reference_images=section_images,
+                    slide_num=i + 1,
+                    total_slides=total,
+                    section_title=section.title,
+                    submit=submit,
+                )
 
-            if save_callback:
-                save_callback(generated_img, i, total)
+                generated_img = GeneratedImage(section_id=section.id, image_data=image_data, mime_type=mime_type)
+                results.append(generated_img)
+
+                if save_callback:
+                    save_callback(generated_img, i, total)
+
+        for future in pending_writes:
+            future.result()  # surface write errors
 
         # Generate INSTRUCTIONS.md after all prompts are exported
         self._generate_instructions_md(total)
 
         return results
 
-    def _generate_slides_api_mode(
+    async def _agenerate_slides_api_mode(
         self,
         plan,
         style_name,
@@ -329,96 +612,147 @@ class ImageGenerator:
         all_sections_md,
         figure_images,
         layouts,
-        max_workers: int,
+        max_concurrent: int,
         save_callback=None,
+        batch_size: int = 1,
     ) -> List[GeneratedImage]:
-        """Generate slides in API mode (first 2 sequential, rest parallel)."""
+        """
+        Async API mode: first 2 slides sequential, the rest concurrent under a semaphore.
+
+        With batch_size > 1, slides from the 3rd onwards are requested batch_size
+        at a time in one multi-image call. Images are matched to slides by
+        position, so a response is only used if it has exactly one image per
+        slide; otherwise the whole group is regenerated one slide per request.
+        """
         results = []
         total = len(plan.sections)
-        style_ref_image = None  # Store 2nd slide as reference for all subsequent slides
+        style_ref_image = None
 
-        # Generate first 2 slides sequentially (slide 1: no ref, slide 2: becomes ref)
+        # Slide 1 has no reference; slide 2 becomes the style reference for the rest
         for i in range(min(2, total)):
             section = plan.sections[i]
-            section_md = self._format_single_section_markdown(section, plan)
-            layout_rule = layouts.get(section.section_type, layouts["content"])
-
-            prompt = self._build_slide_prompt(
-                style_name=style_name,
-                processed_style=processed_style,
-                sections_md=section_md,
-                layout_rule=layout_rule,
-                slide_info=f"Slide {i+1} of {total}",
-                context_md=all_sections_md,
+            prompt, reference_images = self._build_slide_request(
+                plan, i, style_name, processed_style, all_sections_md, figure_images, layouts, style_ref_image
             )
-
-            section_images = self._filter_images([section], figure_images)
-            reference_images = []
-            if style_ref_image:
-                reference_images.append(style_ref_image)
-            reference_images.extend(section_images)
-
-            image_data, mime_type = self._call_model(prompt, reference_images)
-
-            # Save 2nd slide (i=1) as style reference
+            image_data, mime_type = await self._acall_model(prompt, reference_images)
             if i == 1:
-                style_ref_image = {
-                    "figure_id": "Reference Slide",
-                    "caption": "STRICTLY MAINTAIN: same background color, same accent color, same font style, same chart/icon style. Keep visual consistency.",
-                    "base64": base64.b64encode(image_data).decode("utf-8"),
-                    "mime_type": mime_type,
-                }
+                style_ref_image = self._style_reference(image_data, mime_type)
 
             generated_img = GeneratedImage(section_id=section.id, image_data=image_data, mime_type=mime_type)
             results.append(generated_img)
-
-            # Save immediately if callback provided
             if save_callback:
                 save_callback(generated_img, i, total)
 
-        # Generate remaining slides in parallel (from 3rd onwards)
-        if total > 2:
-            results_dict = {}
-
-            def generate_single(i, section):
-                section_md = self._format_single_section_markdown(section, plan)
-                layout_rule = layouts.get(section.section_type, layouts["content"])
+        semaphore = asyncio.Semaphore(max_concurrent)
 
-                prompt = self._build_slide_prompt(
-                    style_name=style_name,
-                    processed_style=processed_style,
-                    sections_md=section_md,
-                    layout_rule=layout_rule,
-                    slide_info=f"Slide {i+1} of {total}",
-                    context_md=all_sections_md,
+        async def generate_single(i, section):
+            prompt, reference_images = self._build_slide_request(
+                plan, i, style_name, processed_style, all_sections_md, figure_images, layouts, style_ref_image
+            )
+            async with semaphore:
+                image_data, mime_type = await self._acall_model(prompt, reference_images)
+            generated_img = GeneratedImage(section_id=section.id, image_data=image_data, mime_type=mime_type)
+            if save_callback:
+                save_callback(generated_img, i, total)
+            return generated_img
+
+        async def generate_group(group):
+            # The prompt prefix (style, hints, deck context) and the style
+            # reference are sent once for the whole group, not per slide
+            requests = [
+                self._build_slide_request(
+                    plan, i, style_name, processed_style, all_sections_md, figure_images, layouts, None,
+                    with_prefix=False,
                 )
+                for i in group
+            ]
+            shared_prompt = self._slide_prompt_prefix(style_name, processed_style, all_sections_md)
+            shared_refs = [style_ref_image] if style_ref_image else []
+            try:
+                async with semaphore:
+                    images = await self._acall_model_batch(requests, shared_refs, shared_prompt)
+            except Exception as e:
+                logging.getLogger(__name__).warning(
+                    f"Batch request for slides {group[0]+1}-{group[-1]+1} failed ({e}), generating one by one"
+                )
+                images = None
+
+            # With a missing or extra image there is no telling which slide each
+            # image belongs to, so nothing from the response is kept
+            if images is None or len(images) != len(group):
+                if images is not None:
+                    logging.getLogger(__name__).warning(
+                        f"Batch request for slides {group[0]+1}-{group[-1]+1} returned "
+                        f"{len(images)}/{len(group)} images, generating one by one"
+                    )
+                return await asyncio.gather(*(generate_single(i, plan.sections[i]) for i in group))
+
+            generated = []
+            for i, (image_data, mime_type) in zip(group, images):
+                generated_img = GeneratedImage(section_id=plan.sections[i].id, image_data=image_data, mime_type=mime_type)
+                if save_callback:
+                    save_callback(generated_img, i, total)
+                generated.append(generated_img)
+            return generated
+
+        remaining = list(range(2, total))
+        if batch_size > 1:
+            groups = [remaining[k:k + batch_size] for k in range(0, len(remaining), batch_size)]
+            # gather() keeps slide order regardless of completion order
+            for generated in await asyncio.gather(*(generate_group(g) for g in groups)):
+                results.extend(generated)
+        else:
+            results.extend(await asyncio.gather(
+                *(generate_single(i, plan.sections[i]) for i in remaining)
+            ))
+        return results
 
-                section_images = self._filter_images([section], figure_images)
-                reference_images = [style_ref_image] if style_ref_image else []
-                reference_images.extend(section_images)
-
-                image_data, mime_type = self._call_model(prompt, reference_images)
-                return i, GeneratedImage(section_id=section.id, image_data=image_data, mime_type=mime_type)
-
-            with ThreadPoolExecutor(max_workers=max_workers) as executor:
-                futures = {
-                    executor.submit(generate_single, i, plan.sections[i]): i
-                    for i in range(2, total)
-                }
-
-                for future in as_completed(futures):
-                    idx, generated_img = future.result()
-                    results_dict[idx] = generated_img
-
-                    # Save immediately if callback provided
-                    if save_callback:
-                        save_callback(generated_img, idx, total)
+    def _build_slide_request(
+        self,
+        plan,
+        i: int,
+        style_name,
+        processed_style: Optional[ProcessedStyle],
+        all_sections_md,
+        figure_images,
+        layouts,
+        style_ref_image: Optional[MappingProxyType],
+        with_prefix: bool = True,
+    ) -> Tuple[str, tuple]:
+        """
+        Build the prompt and reference images (style reference first) for slide i.
 
-            # Append in order
-            for i in range(2, total):
-                results.append(results_dict[i])
+        With with_prefix=False the prompt is only the slide-specific body, for
+        requests that send _slide_prompt_prefix once for several slides.
+        """
+        section = plan.sections[i]
+        section_md = self._section_mds[i]
+        layout_rule = layouts.get(section.section_type, layouts["content"])
+        slide_info = f"Slide {i+1} of {len(plan.sections)}"
 
-        return results
+        if with_prefix:
+            prompt = self._build_slide_prompt(
+                style_name=style_name,
+                processed_style=processed_style,
+                sections_md=section_md,
+                layout_rule=layout_rule,
+                slide_info=slide_info,
+                context_md=all_sections_md,
+            )
+        else:
+            prompt = self._slide_prompt_body(style_name, processed_style, section_md, layout_rule, slide_info)
+
+        reference_images = ((style_ref_image,) if style_ref_image else ()) + self._section_images[i]
+        return prompt, reference_images
+
+    def _style_reference(self, image_data: bytes, mime_type: str) -> MappingProxyType:
+        """Wrap a generated slide as the (read-only) style reference for subsequent slides."""
+        return MappingProxyType({
+            "figure_id": "Reference Slide",
+            "caption": "STRICTLY MAINTAIN: same background color, same accent color, same font style, same chart/icon style. Keep visual consistency.",
+            "bytes": image_data,
+            "mime_type": mime_type,
+        })
 
     def _generate_instructions_md(self, total_slides: int):
         """Generate INSTRUCTIONS.md file with workflow guide."""
@@ -551,34 +885,56 @@ prompts/
     
     def _build_slide_prompt(self, style_name, processed_style: Optional[ProcessedStyle], sections_md, layout_rule, slide_info, context_md) -> str:
         """Build prompt for slide with layout rules and consistency."""
-        parts = [FORMAT_SLIDE]
-        
-        if style_name == "custom" and processed_style:
-            parts.append(f"Style: {self._format_custom_style_for_slide(processed_style)}")
-        else:
-            parts.append(SLIDE_STYLE_HINTS.get(style_name, SLIDE_STYLE_HINTS["academic"]))
-        
-        # Add layout rule, then decorations if custom style
-        parts.append(layout_rule)
+        return "\n\n".join([
+            self._slide_prompt_prefix(style_name, processed_style, context_md),
+            self._slide_prompt_body(style_name, processed_style, sections_md, layout_rule, slide_info),
+        ])
+
+    def _slide_prompt_body(self, style_name, processed_style: Optional[ProcessedStyle], sections_md, layout_rule, slide_info) -> str:
+        """Build the slide-specific tail of a slide prompt (follows _slide_prompt_prefix)."""
+        # Layout rule, then decorations if custom style
+        parts = [layout_rule]
         if style_name == "custom" and processed_style and processed_style.decorations:
             parts.append(f"Decorations: {processed_style.decorations}")
         
-        parts.append(VISUALIZATION_HINTS)
-        parts.append(CONSISTENCY_HINT)
-        parts.append(SLIDE_FIGURE_HINT)
-        
         parts.append(slide_info)
-        parts.append(f"---\nFull presentation context:\n{context_md}")
         parts.append(f"---\nThis slide content:\n{sections_md}")
         
         return "\n\n".join(parts)
+
+    def _slide_prompt_prefix(self, style_name, processed_style: Optional[ProcessedStyle], context_md) -> str:
+        """
+        Build the slide-independent head of every slide prompt (once per deck).
+
+        Slide prompts share it byte for byte, so providers with prompt caching
+        can reuse the full presentation context across slide requests.
+        """
+        key = (style_name, processed_style, context_md)
+        if key != self._slide_prefix_key:
+            parts = [FORMAT_SLIDE]
+            if style_name == "custom" and processed_style:
+                parts.append(f"Style: {self._format_custom_style_for_slide(processed_style)}")
+            else:
+                parts.append(SLIDE_STYLE_HINTS.get(style_name, SLIDE_STYLE_HINTS["academic"]))
+            parts.append(VISUALIZATION_HINTS)
+            parts.append(CONSISTENCY_HINT)
+            parts.append(SLIDE_FIGURE_HINT)
+            parts.append(f"---\nFull presentation context:\n{context_md}")
+            self._slide_prefix = "\n\n".join(parts)
+            self._slide_prefix_key = key
+        return self._slide_prefix
     
     def _format_sections_markdown(self, plan: ContentPlan) -> str:
-        """Format all sections as markdown."""
-        parts = []
-        for section in plan.sections:
-            parts.append(self._format_single_section_markdown(section, plan))
-        return "\n\n---\n\n".join(parts)
+        """
+        Format all sections as markdown.
+
+        Each section is rendered once and kept in self._section_mds, so slide
+        prompts reuse it instead of formatting the section again.
+        """
+        self._section_mds = [
+            self._format_single_section_markdown(section, plan) for section in plan.sections
+        ]
+        return "\n\n---\n\n".join(self._section_mds)
     
     def _format_single_section_markdown(self, section: Section, plan: ContentPlan) -> str:
         """Format a single section as markdown."""
@@ -603,103 +959,96 @@ prompts/
         
         return "\n".join(lines)
     
-    def _load_figure_images(self, plan: ContentPlan, base_path: str) -> List[dict]:
-        """Load figure images as base64."""
-        images = []
-        mime_map = {
-            ".jpg": "image/jpeg", ".jpeg": "image/jpeg",
-            ".png": "image/png", ".webp": "image/webp", ".gif": "image/gif"
-        }
+    def _load_figure_images(self, plan: ContentPlan, base_path: str) -> Tuple[MappingProxyType, ...]:
+        """
+        Load figure images as raw bytes (base64-encoded only when sent).
+
+        File contents are cached on (path, mtime, size) for the current run,
+        and each figure is one read-only mapping shared by every slide that
+        references it.
+        """
+        figures = list(plan.figures_index.items())
+        if not figures:
+            return ()
+        # File reads and encodes overlap across threads; map() keeps figure order
+        with ThreadPoolExecutor(max_workers=min(FIGURE_LOAD_WORKERS, len(figures))) as executor:
+            loaded = executor.map(lambda item: self._load_one_figure(*item, base_path), figures)
+            return tuple(image for image in loaded if image is not None)
+
+    def _load_one_figure(self, fig_id: str, fig, base_path: str) -> Optional[MappingProxyType]:
+        """Load one figure as a read-only mapping, or None if it is missing or unreadable."""
+        if base_path:
+            img_path = Path(base_path) / fig.image_path
+        else:
+            img_path = Path(fig.image_path)
         
-        for fig_id, fig in plan.figures_index.items():
-            if base_path:
-                img_path = Path(base_path) / fig.image_path
-            else:
-                img_path = Path(fig.image_path)
-            
-            if not img_path.exists():
-                continue
-            
-            mime_type = mime_map.get(img_path.suffix.lower(), "image/jpeg")
-            
-            try:
-                with open(img_path, "rb") as f:
-                    img_data = base64.b64encode(f.read()).decode("utf-8")
-                images.append({
-                    "figure_id": fig_id,
-                    "caption": fig.caption,
-                    "base64": img_data,
-                    "mime_type": mime_type,
-                })
-            except Exception:
-                continue
+        if not img_path.exists():
+            return None
         
-        return images
+        mime_type = FIGURE_MIME_TYPES.get(img_path.suffix.lower(), "image/jpeg")
+        
+        try:
+            stat = img_path.stat()
+            key = (str(img_path.resolve()), stat.st_mtime_ns, stat.st_size)
+            img_data = self._file_cache.get(key)
+            if img_data is None:
+                img_data = self._file_cache[key] = img_path.read_bytes()
+        except Exception:
+            return None
+        return MappingProxyType({
+            "figure_id": fig_id,
+            "caption": fig.caption,
+            "bytes": img_data,
+            "mime_type": mime_type,
+            "source_path": str(img_path),
+        })
     
-    def _filter_images(self, sections: List[Section], figure_images: List[dict]) -> List[dict]:
-        """Filter images used in given sections."""
+    def _filter_images(self, sections: List[Section], figure_images: tuple) -> tuple:
+        """Filter images used in given sections (a tuple of the shared figure mappings)."""
         used_ids = set()
         for section in sections:
             for ref in section.figures:
                 used_ids.add(ref.figure_id)
-        return [img for img in figure_images if img.get("figure_id") in used_ids]
+        return tuple(img for img in figure_images if img["figure_id"] in used_ids)
 
-    def _create_placeholder_image(self, slide_num: int, title: str = "") -> Tuple[bytes, str]:
-        """Create a placeholder image for prompt export mode."""
-        # Create 16:9 placeholder
-        img = Image.new('RGB', (PLACEHOLDER_WIDTH, PLACEHOLDER_HEIGHT), color=PLACEHOLDER_BG_COLOR)
-        draw = ImageDraw.Draw(img)
-
-        # Draw border
-        draw.rectangle(
-            [10, 10, PLACEHOLDER_WIDTH - 10, PLACEHOLDER_HEIGHT - 10],
-            outline=PLACEHOLDER_BORDER_COLOR,
-            width=PLACEHOLDER_BORDER_WIDTH,
-        )
+    def _index_section_images(self, sections: List[Section], figure_images: tuple) -> List[tuple]:
+        """
+        Images used by each section, aligned with sections.
 
-        # Build slide directory and filename using constants
-        slide_dir = SLIDE_DIR_TEMPLATE.format(slide_num)
-        prompt_file = SLIDE_PROMPT_TEMPLATE.format(slide_num)
-
-        # Draw centered text
-        text_lines = [
-            f"SLIDE {slide_num:02d}",
-            "",
-            "Placeholder Image",
-            "",
-            "Generate this slide manually using:",
-            prompt_file,
-            "",
-            "Then place the generated image as:",
-            f"{slide_dir}/{GENERATED_IMAGE_FILENAME}",
+        Same result as _filter_images([section], ...) per section (figure_images
+        order, no duplicates), in one pass over the figures.
+        """
+        position = {img["figure_id"]: pos for pos, img in enumerate(figure_images)}
+        return [
+            tuple(figure_images[pos] for pos in sorted({
+                position[ref.figure_id] for ref in section.figures if ref.figure_id in position
+            }))
+            for section in sections
         ]
-        if title:
-            text_lines.insert(1, f"({title})")
-
-        # Load fonts with cross-platform support
-        font_large = _load_font(FONT_PATHS_BOLD, 48)
-        font_medium = _load_font(FONT_PATHS_REGULAR, 32)
 
-        y_position = 200
-        for i, line in enumerate(text_lines):
-            font = font_large if i == 0 else font_medium
-            color = PLACEHOLDER_TITLE_COLOR if i == 0 else PLACEHOLDER_TEXT_COLOR
-            bbox = draw.textbbox((0, 0), line, font=font)
-            text_width = bbox[2] - bbox[0]
-            x = (PLACEHOLDER_WIDTH - text_width) // 2
-            draw.text((x, y_position), line, fill=color, font=font)
-            y_position += 60 if i == 0 else 45
+    def _create_placeholder_image(self, slide_num: int, title: str = "") -> Tuple[bytes, str]:
+        """Create a placeholder image for prompt export mode."""
+        # Only the per-slide lines are drawn here; the rest is in the template
+        img = _placeholder_template(bool(title)).copy()
+        _draw_placeholder_lines(ImageDraw.Draw(img), _placeholder_lines(slide_num, title, static=False))
 
         # Convert to bytes
-        buffer = io.BytesIO()
-        img.save(buffer, format='PNG')
-        return buffer.getvalue(), 'image/png'
+        return _encode_png(img, PLACEHOLDER_PNG_COMPRESS_LEVEL), 'image/png'
 
-    def _save_reference_images(self, slide_dir: Path, reference_images: List[dict]) -> List[str]:
-        """Save reference images to slide directory and return filenames."""
+    def _save_reference_images(self, slide_dir: Path, reference_images: List[dict], submit=None) -> List[str]:
+        """
+        Save reference images to slide directory and return filenames.
+
+        Args:
+            slide_dir: Existing directory the images are written to
+            reference_images: Figure/style reference dicts
+            submit: Optional submit(fn, *args) that runs the writes elsewhere
+                (e.g. a thread pool); by default they run immediately
+        """
+        submit = submit or _call_now
         saved_files = []
         for i, img in enumerate(reference_images):
-            if not img.get("base64"):
+            if not img.get("bytes"):
                 continue
             fig_id = img.get("figure_id", f"image_{i}")
             # Sanitize filename
@@ -708,9 +1057,12 @@ prompts/
             filename = f"ref_{i:02d}_{safe_name}{ext}"
             filepath = slide_dir / filename
 
-            img_data = base64.b64decode(img["base64"])
-            with open(filepath, "wb") as f:
-                f.write(img_data)
+            source_path = img.get("source_path")
+            if source_path and os.path.exists(source_path):
+                # Kernel-side copy of the original file
+                submit(shutil.copyfile, source_path, filepath)
+            else:
+                submit(filepath.write_bytes, img["bytes"])
             saved_files.append(filename)
         return saved_files
 
@@ -746,8 +1098,9 @@ This ensures consistent visual style across all {total_slides} slides.
         slide_num: int,
         total_slides: int,
         section_title: str = "",
+        submit=None,
     ) -> Tuple[bytes, str]:
-        """Export prompt and reference images for manual generation."""
+        """Export prompt and reference images for manual generation (see _save_reference_images for submit)."""
         logger = logging.getLogger(__name__)
 
         if not self.prompt_output_dir:
@@ -760,7 +1113,7 @@ This ensures consistent visual style across all {total_slides} slides.
         slide_dir.mkdir(exist_ok=True)
 
         # Save reference images
-        saved_refs = self._save_reference_images(slide_dir, reference_images)
+        saved_refs = self._save_reference_images(slide_dir, reference_images, submit)
 
         # Build reference chain instruction
         ref_chain_instruction = self._build_reference_chain_instruction(slide_num, total_slides)
@@ -768,22 +1121,21 @@ This ensures consistent visual style across all {total_slides} slides.
         # Build slide directory name using constant
         slide_dir_name = SLIDE_DIR_TEMPLATE.format(slide_num)
 
-        # Build complete prompt file
-        prompt_content = f"""# Slide {slide_num:02d} of {total_slides}
+        # Build complete prompt file (joined once, written in one call)
+        parts = [f"""# Slide {slide_num:02d} of {total_slides}
 {f'## {section_title}' if section_title else ''}
 
 {ref_chain_instruction}
 
 ## REFERENCE IMAGES TO UPLOAD
 Directory: {slide_dir_name}/
-"""
+"""]
         if saved_refs:
-            for ref_file in saved_refs:
-                prompt_content += f"- {ref_file}\n"
+            parts.extend([f"- {ref_file}\n" for ref_file in saved_refs])
         else:
-            prompt_content += "- (No reference images for this slide)\n"
+            parts.append("- (No reference images for this slide)\n")
 
-        prompt_content += f"""
+        parts.append(f"""
 ## RAW PROMPT FOR NANO BANANA
 Copy everything below this line into Nano Banana Pro Chat:
 
@@ -797,12 +1149,11 @@ Copy everything below this line into Nano Banana Pro Chat:
 1. Download the generated image
 2. Save as: {slide_dir_name}/{GENERATED_IMAGE_FILENAME}
 3. Continue to the next slide prompt
-"""
+""")
 
         # Save prompt file
         prompt_file = self.prompt_output_dir / SLIDE_PROMPT_TEMPLATE.format(slide_num)
-        with open(prompt_file, "w", encoding="utf-8") as f:
-            f.write(prompt_content)
+        (submit or _call_now)(prompt_file.write_text, "".join(parts), "utf-8")
 
         logger.info(f"  Exported prompt: {prompt_file.name}")
 
@@ -818,121 +1169,316 @@ Copy everything below this line into Nano Banana Pro Chat:
         # Return placeholder image
         return self._create_placeholder_image(slide_num, section_title)
 
-    def _call_model(self, prompt: str, reference_images: List[dict]) -> tuple:
-        """Call the image generation model with retry logic."""
-        logger = logging.getLogger(__name__)
+    def _build_model_content(self, prompt: str, reference_images: List[dict]) -> List[dict]:
+        """Build the multimodal message content: prompt, then labelled reference images."""
         content = [{"type": "text", "text": prompt}]
         
         # Add each image with figure_id and caption label
         for img in reference_images:
-            if img.get("base64") and img.get("mime_type"):
+            if img.get("bytes") and img.get("mime_type"):
                 fig_id = img.get("figure_id", "Figure")
                 caption = img.get("caption", "")
                 label = f"[{fig_id}]: {caption}" if caption else f"[{fig_id}]"
                 content.append({"type": "text", "text": label})
-                content.append({
-                    "type": "image_url",
-                    "image_url": {"url": f"data:{img['mime_type']};base64,{img['base64']}"}
-                })
-        
-        # Retry logic for API calls
-        max_retries = 3
-        retry_delay = 2  # seconds
-        
-        for attempt in range(max_retries):
-            try:
-                logger.info(f"Calling image generation API (attempt {attempt + 1}/{max_retries})...")
-                
-                response = self.client.chat.completions.create(
-                    model=self.model,
-                    messages=[{"role": "user", "content": content}],
-                    extra_body={"modalities": ["image", "text"]}
-                )
-                
-                # Check if response is valid
-                if response is None:
-                    error_msg = "API returned None response - possible rate limit or API error"
-                    logger.warning(f"{error_msg} (attempt {attempt + 1}/{max_retries})")
-                    if attempt < max_retries - 1:
-                        time.sleep(retry_delay * (attempt + 1))
-                        continue
-                    raise RuntimeError(error_msg)
-                
-                if not hasattr(response, 'choices') or not response.choices:
-                    error_msg = f"API response has no choices: {response}"
-                    logger.warning(f"{error_msg} (attempt {attempt + 1}/{max_retries})")
-                    if attempt < max_retries - 1:
-                        time.sleep(retry_delay * (attempt + 1))
-                        continue
-                    raise RuntimeError(error_msg)
-                
-                message = response.choices[0].message
-                if hasattr(message, 'images') and message.images:
-                    image_url = message.images[0]['image_url']['url']
-                    if image_url.startswith('data:'):
-                        header, base64_data = image_url.split(',', 1)
-                        mime_type = header.split(':')[1].split(';')[0]
-                        logger.info("Image generation successful")
-                        return base64.b64decode(base64_data), mime_type
-                
-                error_msg = "Image generation failed - no images in response"
-                logger.warning(f"{error_msg} (attempt {attempt + 1}/{max_retries})")
-                if attempt < max_retries - 1:
-                    time.sleep(retry_delay * (attempt + 1))
-                    continue
-                raise RuntimeError(error_msg)
-                
-            except Exception as e:
-                logger.error(f"Error in API call (attempt {attempt + 1}/{max_retries}): {str(e)}")
-                if attempt < max_retries - 1:
-                    time.sleep(retry_delay * (attempt + 1))
-                    continue
-                raise
-        
-        raise RuntimeError("Image generation failed after all retry attempts")
+                key = (img["mime_type"], img["bytes"])
+                part = self._image_parts.get(key)
+                if part is None:
+                    part = self._image_parts[key] = _image_url_part(*key)
+                content.append(part)
+        return content
+
+    def _parse_image_response(self, response) -> tuple:
+        """
+        Extract (image_bytes, mime_type) from an image generation response.
+
+        Raises:
+            RuntimeError: If the response carries no image
+        """
+        images = self._parse_image_responses(response)
+        if not images:
+            raise RuntimeError("Image generation failed - no images in response")
+        return images[0]
+
+    def _parse_image_responses(self, response) -> List[tuple]:
+        """
+        Extract every (image_bytes, mime_type) from a response, in order.
+
+        Raises:
+            RuntimeError: If the response is empty or has no choices
+        """
+        if response is None:
+            raise RuntimeError("API returned None response - possible rate limit or API error")
+        if not hasattr(response, 'choices') or not response.choices:
+            raise RuntimeError(f"API response has no choices: {response}")
+
+        message = response.choices[0].message
+        images = []
+        for image in getattr(message, 'images', None) or []:
+            image_url = image['image_url']['url']
+            if image_url.startswith('data:'):
+                header, base64_data = image_url.split(',', 1)
+                mime_type = header.split(':')[1].split(';')[0]
+                images.append((b64.b64decode(base64_data), mime_type))
+        return images
+
+    async def _acall_model_batch(
+        self,
+        requests: List[Tuple[str, List[dict]]],
+        shared_refs: Optional[List[dict]] = None,
+        shared_prompt: str = "",
+    ) -> List[tuple]:
+        """
+        Request one image per (prompt, reference_images) pair in a single call.
+
+        Args:
+            requests: (prompt, per-slide reference images) for each slide
+            shared_refs: References that apply to every slide (e.g. the style
+                reference), attached once ahead of the slides
+            shared_prompt: Instructions and context that apply to every slide,
+                sent once ahead of the slides
+
+        Returns:
+            Every (image_bytes, mime_type) in the response, in order. The model
+            may return fewer or more images than requested; callers must
+            check the count before matching images to slides (no retry here)
+        """
+        logger = logging.getLogger(__name__)
+        content = [{
+            "type": "text",
+            "text": (
+                f"Generate {len(requests)} separate slide images, one per slide below, "
+                f"in the same order. Return exactly {len(requests)} images."
+            ),
+        }]
+        if shared_prompt:
+            content.append({"type": "text", "text": f"Applies to ALL slides:\n\n{shared_prompt}"})
+        if shared_refs:
+            content.extend(self._build_model_content("Reference images for ALL slides:", shared_refs))
+        for n, (prompt, reference_images) in enumerate(requests, 1):
+            content.append({"type": "text", "text": f"=== SLIDE {n} OF {len(requests)} ==="})
+            # Tag figures with their slide so the model does not mix them up
+            tagged = [
+                {**img, "figure_id": f"Slide {n} {img.get('figure_id', 'Figure')}"}
+                for img in reference_images
+            ]
+            content.extend(self._build_model_content(prompt, tagged))
+
+        logger.info(f"Calling image generation API for {len(requests)} slides in one request...")
+        async with self._throttle():
+            response = await self.async_client.chat.completions.create(
+                model=self.model,
+                messages=[{"role": "user", "content": content}],
+                extra_body={"modalities": ["image", "text"]}
+            )
+        images = self._parse_image_responses(response)
+        logger.info(f"Batch image generation returned {len(images)}/{len(requests)} images")
+        return images
+
+    def _throttle(self):
+        """Wait for a request slot under max_rpm (no-op without a limit)."""
+        return self._rate_limiter.acquire() if self._rate_limiter else contextlib.nullcontext()
+
+    async def _acall_model(self, prompt: str, reference_images: List[dict]) -> tuple:
+        """Call the image generation model with retry logic (shared AsyncOpenAI client)."""
+        # Content is built once; retries resend the same message parts
+        return await self._arequest_image(self._build_model_content(prompt, reference_images))
+
+    @retry(IMAGE_MAX_RETRIES, TRANSIENT_ERRORS, TRANSIENT_MAX_RETRIES, RETRY_BASE_DELAY, RETRY_MAX_DELAY)
+    async def _arequest_image(self, content: List[dict]) -> tuple:
+        """One image generation request; see retry() for the backoff policy."""
+        logger = logging.getLogger(__name__)
+        logger.info("Calling image generation API...")
+        async with self._throttle():
+            response = await self.async_client.chat.completions.create(
+                model=self.model,
+                messages=[{"role": "user", "content": content}],
+                extra_body={"modalities": ["image", "text"]}
+            )
+        result = self._parse_image_response(response)
+        logger.info("Image generation successful")
+        return result
+
+
+def _image_http_client(max_connections: int) -> DefaultAsyncHttpxClient:
+    """
+    Connection pool for one agenerate() run, sized to its in-flight limit.
+
+    Every slide request and retry reuses these kept-alive connections instead
+    of opening new ones; with h2 installed they share HTTP/2 connections.
+    Timeouts and redirects keep the OpenAI SDK defaults.
+    """
+    max_connections = max(1, max_connections)
+    # Limits class of whichever httpx the installed SDK is built on
+    limits = type(DEFAULT_CONNECTION_LIMITS)(
+        max_connections=max_connections, max_keepalive_connections=max_connections
+    )
+    return DefaultAsyncHttpxClient(limits=limits, http2=importlib.util.find_spec("h2") is not None)
+
+
+def _image_url_part(mime_type: str, data: bytes) -> dict:
+    """
+    Message part for an inline image, base64-encoded here and nowhere else.
+
+    ImageGenerator keeps each part for the rest of the run, so the same part
+    (and its multi-MB data URL) is shared by every request that attaches the
+    image, e.g. the style reference on slides 3..N. Callers must not modify it.
+    """
+    return {"type": "image_url", "image_url": {"url": f"data:{mime_type};base64,{b64encode_str(data)}"}}
+
+
+# Per-thread BytesIO reused across PNG encodes (grows to the largest image once)
+_png_buffers = threading.local()
+
+
+def _encode_png(img: Image.Image, compress_level: int) -> bytes:
+    """Encode an image as PNG into this thread's reusable buffer."""
+    buffer = getattr(_png_buffers, "buffer", None)
+    if buffer is None:
+        buffer = _png_buffers.buffer = io.BytesIO()
+    buffer.seek(0)
+    buffer.truncate()
+    img.save(buffer, format='PNG', compress_level=compress_level)
+    return buffer.getvalue()
+
+
+def _call_now(fn, *args):
+    fn(*args)
+
+
+def _decode_for_pdf(img: GeneratedImage) -> Image.Image:
+    """Decode one generated image into an RGB page (PDF doesn't support alpha)."""
+    pil_img = Image.open(io.BytesIO(img.image_data))
+    pil_img.load()  # Image.open is lazy; decode here, in the worker thread
+    if pil_img.mode != 'RGB':
+        rgb = pil_img.convert('RGB')
+        pil_img.close()
+        return rgb
+    return pil_img
+
+
+def _save_pdf_direct(images: List[GeneratedImage], output_path: str) -> bool:
+    """
+    Embed PNG/JPEG bytes into a PDF without re-encoding (requires img2pdf).
+
+    Returns:
+        True if the PDF was written, False if the caller should fall back to PIL
+    """
+    if not all(img.image_data.startswith(PDF_DIRECT_SIGNATURES) for img in images):
+        return False
+    try:
+        import img2pdf
+    except ImportError:
+        return False
+
+    try:
+        # Same page size as the PIL path (resolution=100)
+        pdf_bytes = img2pdf.convert(
+            [img.image_data for img in images],
+            layout_fun=img2pdf.get_fixed_dpi_layout_fun((100, 100)),
+        )
+    except Exception as e:
+        # e.g. PNGs with an alpha channel, which PDF images cannot carry
+        logging.getLogger(__name__).info(f"img2pdf could not embed images ({e}), re-encoding with PIL")
+        return False
+
+    Path(output_path).write_bytes(pdf_bytes)
+    return True
+
+
+def _decode_pages(images: List[GeneratedImage]):
+    """
+    Yield decoded PDF pages in slide order.
+
+    PIL releases the GIL while decoding, so pages decode in parallel ahead
+    of the consumer. At most PDF_DECODE_AHEAD pages are submitted but not yet
+    yielded; a new one is only submitted once the consumer asks for the next
+    page, by which point it has closed the previous one.
+    """
+    with ThreadPoolExecutor(max_workers=min(PDF_DECODE_AHEAD, len(images) or 1)) as executor:
+        pending = deque()
+        for img in images:
+            pending.append(executor.submit(_decode_for_pdf, img))
+            if len(pending) >= PDF_DECODE_AHEAD:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
 
 
 def save_images_as_pdf(images: List[GeneratedImage], output_path: str):
     """
     Save generated images as a single PDF file.
     
+    Images are read from the in-memory bytes held by each GeneratedImage;
+    the files written during generation are never re-read. When img2pdf is
+    installed and every image is PNG/JPEG, the original bytes are embedded
+    as-is; otherwise pages are decoded and re-encoded with PIL, one page
+    appended to the file at a time.
+    
     Args:
         images: List of GeneratedImage from ImageGenerator.generate()
         output_path: Output PDF file path
     """
-    from PIL import Image
-    import io
-    
-    pdf_images = []
-    
-    for img in images:
-        # Load image from bytes
-        pil_img = Image.open(io.BytesIO(img.image_data))
-        
-        # Convert RGBA to RGB (PDF doesn't support alpha)
-        if pil_img.mode == 'RGBA':
-            pil_img = pil_img.convert('RGB')
-        elif pil_img.mode != 'RGB':
-            pil_img = pil_img.convert('RGB')
-        
-        pdf_images.append(pil_img)
-    
-    if pdf_images:
-        # Save first image and append the rest
-        pdf_images[0].save(
-            output_path,
-            save_all=True,
-            append_images=pdf_images[1:] if len(pdf_images) > 1 else [],
-            resolution=100.0,
-        )
-        print(f"PDF saved: {output_path}")
+    logger = logging.getLogger(__name__)
+    if not images:
+        return
+    if _save_pdf_direct(images, output_path):
+        logger.info(f"PDF saved: {output_path}")
+        return
+
+    # PIL's save_all collects every page before writing, so append page by
+    # page instead and close each decoded frame as soon as it is written
+    # (explicitly: newer Pillow no longer closes an image on leaving a with block)
+    for n, page in enumerate(_decode_pages(images)):
+        try:
+            page.save(output_path, format="PDF", append=n > 0, resolution=100.0)
+        finally:
+            page.close()
+    logger.info(f"PDF saved: {output_path}")
+
+
+# Serializes _pptx_media_stored() blocks so overlapping ones cannot restore
+# each other's patch
+_pptx_writer_lock = threading.Lock()
+
+
+@contextlib.contextmanager
+def _pptx_media_stored():
+    """
+    Within the block, python-pptx stores ppt/media/* parts without deflate.
+
+    Slide images are already PNG/JPEG-compressed, so deflating them again
+    costs CPU for next to no size gain; XML parts are still deflated. The
+    private zip writer is only patched for the duration of the block and
+    restored on exit; nothing changes if it is not where this expects it.
+    """
+    try:
+        from pptx.opc.serialized import _ZipPkgWriter
+    except ImportError:
+        yield
+        return
+
+    with _pptx_writer_lock:
+        write = _ZipPkgWriter.write
+
+        def write_media_stored(self, pack_uri, blob):
+            if pack_uri.membername.startswith("ppt/media/"):
+                self._zipf.writestr(pack_uri.membername, blob, compress_type=zipfile.ZIP_STORED)
+            else:
+                write(self, pack_uri, blob)
+
+        _ZipPkgWriter.write = write_media_stored
+        try:
+            yield
+        finally:
+            _ZipPkgWriter.write = write
 
 
 def save_images_as_pptx(images: List[GeneratedImage], output_path: str, title: str = "Generated Presentation"):
     """
     Save generated images as a PowerPoint presentation.
 
-    Each image becomes a full-slide background image (16:9 aspect ratio).
+    Each image becomes a full-slide background image (16:9 aspect ratio),
+    embedded straight from the in-memory bytes without touching disk.
 
     Args:
         images: List of GeneratedImage from ImageGenerator.generate()
@@ -955,28 +1501,94 @@ def save_images_as_pptx(images: List[GeneratedImage], output_path: str, title: s
 
     # Add blank layout
     blank_layout = prs.slide_layouts[6]  # Blank layout
+    # Loop-invariant picture geometry
+    origin = Inches(0)
+    width, height = prs.slide_width, prs.slide_height
+    add_slide = prs.slides.add_slide
 
     for img in images:
-        # Add slide
-        slide = prs.slides.add_slide(blank_layout)
-
-        # Save image temporarily to add to slide
-        img_stream = io.BytesIO(img.image_data)
-
         # Add image as full-slide background
-        slide.shapes.add_picture(
-            img_stream,
-            Inches(0),
-            Inches(0),
-            width=prs.slide_width,
-            height=prs.slide_height,
+        add_slide(blank_layout).shapes.add_picture(
+            io.BytesIO(img.image_data), origin, origin, width=width, height=height
         )
 
     # Save presentation
-    prs.save(output_path)
+    with _pptx_media_stored():
+        prs.save(output_path)
     logger.info(f"PPTX saved: {output_path}")
 
 
+def _iter_checkpoint_sections(checkpoint_path: Path) -> Iterator[dict]:
+    """
+    Yield the plan sections of a checkpoint_plan.json, in order.
+
+    With ijson installed, sections are parsed one at a time straight from the
+    file, so the rest of the checkpoint is never loaded and the caller can
+    stop early; otherwise (or if ijson rejects the file, e.g. NaN literals in
+    an older checkpoint) the whole file is parsed with decode_json.
+    """
+    yielded = 0
+    try:
+        import ijson
+    except ImportError:
+        pass
+    else:
+        try:
+            with open(checkpoint_path, "rb") as f:
+                for section in ijson.items(f, "plan.sections.item", use_float=True):
+                    yield section
+                    yielded += 1
+            return
+        except ijson.JSONError:
+            pass
+
+    sections = decode_json(checkpoint_path.read_bytes()).get("plan", {}).get("sections", [])
+    yield from sections[yielded:]
+
+
+def _section_notes(section: dict) -> str:
+    """Speaker notes for one plan section: narrative, else rich, else title and content."""
+    # Enhanced narrative notes (from --enhance-speaker-notes) cover most slides; return early
+    if "speaker_notes_narrative" in section:
+        return section["speaker_notes_narrative"]
+
+    title = section.get("title", "")
+    notes_data = section.get("speaker_notes")
+    if notes_data and notes_data.get("talking_points"):
+        return _format_rich_notes(title, notes_data)
+
+    content = section.get("content", "")
+    return f"{title}\n\n{content}" if title else content
+
+
+def _format_rich_notes(title: str, notes_data: dict) -> str:
+    """Format rich speaker notes: talking points, key terms, transition and duration."""
+    key_terms = notes_data.get("key_terms")
+    transition = notes_data.get("transition")
+    blocks = [
+        f"## {title}\n\n### Key Points:\n" + "\n".join([f"• {point}" for point in notes_data["talking_points"]]),
+        f"**Emphasize:** {', '.join(key_terms)}" if key_terms else None,
+        f"**Transition:** {transition}" if transition else None,
+        f"⏱️ ~{notes_data.get('duration_minutes', 2)} minutes",
+    ]
+    return "\n\n".join(block for block in blocks if block)
+
+
+def _find_generated_image(slide_dir: Path) -> Optional[str]:
+    """
+    Path of a slide's generated image, or None.
+
+    generated.png wins over IMPORT_ALTERNATIVE_FILENAMES (in list order);
+    the directory is listed once instead of probing each name.
+    """
+    with os.scandir(slide_dir) as entries:
+        names = {entry.name: entry.path for entry in entries}
+    return next(
+        (names[name] for name in (GENERATED_IMAGE_FILENAME, *IMPORT_ALTERNATIVE_FILENAMES) if name in names),
+        None,
+    )
+
+
 def import_generated_images(prompt_dir: str, output_path: str):
     """
     Import manually generated images from prompt export directory into PPTX.
@@ -991,15 +1603,20 @@ def import_generated_images(prompt_dir: str, output_path: str):
     Returns:
         List of missing slides (if any)
     """
-    import json
     from pptx import Presentation
     from pptx.util import Inches
 
     logger = logging.getLogger(__name__)
     prompt_path = Path(prompt_dir)
 
-    # Find all slide directories
-    slide_dirs = sorted(prompt_path.glob("slide_*_images"))
+    # Find all slide directories as (slide number, path), in slide order;
+    # scandir entries carry their type, so no stat per candidate
+    with os.scandir(prompt_path) as entries:
+        slide_dirs = sorted(
+            (int(match.group(1)), Path(entry.path))
+            for entry in entries
+            if (match := SLIDE_DIR_PATTERN.fullmatch(entry.name)) and entry.is_dir()
+        )
     if not slide_dirs:
         raise ValueError(f"No slide directories found in {prompt_dir}")
 
@@ -1016,58 +1633,19 @@ def import_generated_images(prompt_dir: str, output_path: str):
             break
 
     if checkpoint_path:
+        # Sections are only read until every slide directory has its notes
+        wanted = {slide_num for slide_num, _ in slide_dirs}
         try:
-            with open(checkpoint_path, "r", encoding="utf-8") as f:
-                checkpoint_data = json.load(f)
-            plan = checkpoint_data.get("plan", {})
-            sections = plan.get("sections", [])
-            for section in sections:
+            for section in _iter_checkpoint_sections(checkpoint_path):
                 slide_id = section.get("id", "")  # e.g., "slide_01"
-                if slide_id.startswith("slide_"):
-                    slide_num = int(slide_id.split("_")[1])
-                    title = section.get("title", "")
-                    content = section.get("content", "")
-
-                    # Check for enhanced narrative notes first (from --enhance-speaker-notes)
-                    if "speaker_notes_narrative" in section:
-                        notes_text = section["speaker_notes_narrative"]
-                    else:
-                        # Check for rich speaker notes
-                        notes_data = section.get("speaker_notes", {})
-                        if notes_data and notes_data.get("talking_points"):
-                            # Format rich speaker notes
-                            notes_parts = [f"## {title}\n"]
-
-                            # Add talking points
-                            talking_points = notes_data.get("talking_points", [])
-                            if talking_points:
-                                notes_parts.append("### Key Points:")
-                                for point in talking_points:
-                                    notes_parts.append(f"• {point}")
-                                notes_parts.append("")
-
-                            # Add key terms to emphasize
-                            key_terms = notes_data.get("key_terms", [])
-                            if key_terms:
-                                notes_parts.append(f"**Emphasize:** {', '.join(key_terms)}")
-                                notes_parts.append("")
-
-                            # Add transition
-                            transition = notes_data.get("transition", "")
-                            if transition:
-                                notes_parts.append(f"**Transition:** {transition}")
-                                notes_parts.append("")
-
-                            # Add duration
-                            duration = notes_data.get("duration_minutes", 2)
-                            notes_parts.append(f"⏱️ ~{duration} minutes")
-
-                            notes_text = "\n".join(notes_parts)
-                        else:
-                            # Fallback to basic format
-                            notes_text = f"{title}\n\n{content}" if title else content
-
-                    speaker_notes[slide_num] = notes_text
+                if not slide_id.startswith("slide_"):
+                    continue
+                slide_num = int(slide_id.split("_")[1])
+                # Notes are only formatted for slides that have a directory
+                if slide_num in wanted:
+                    speaker_notes[slide_num] = _section_notes(section)
+                    if wanted <= speaker_notes.keys():
+                        break
             logger.info(f"Loaded speaker notes for {len(speaker_notes)} slides")
         except Exception as e:
             logger.warning(f"Could not load speaker notes: {e}")
@@ -1077,39 +1655,23 @@ def import_generated_images(prompt_dir: str, output_path: str):
     prs.slide_width = Inches(13.333)
     prs.slide_height = Inches(7.5)
     blank_layout = prs.slide_layouts[6]
+    origin = Inches(0)
+    width, height = prs.slide_width, prs.slide_height
+    add_slide = prs.slides.add_slide
 
     missing_slides = []
     imported_count = 0
 
-    for slide_dir in slide_dirs:
-        # Extract slide number from directory name
-        dir_name = slide_dir.name  # e.g., "slide_01_images"
-        slide_num = int(dir_name.split("_")[1])
-
-        # Look for generated image
-        generated_img = slide_dir / GENERATED_IMAGE_FILENAME
-        if not generated_img.exists():
-            # Try alternative filenames
-            for alt_name in IMPORT_ALTERNATIVE_FILENAMES:
-                alt_path = slide_dir / alt_name
-                if alt_path.exists():
-                    generated_img = alt_path
-                    break
-
-        if not generated_img.exists():
+    for slide_num, slide_dir in slide_dirs:
+        generated_img = _find_generated_image(slide_dir)
+        if generated_img is None:
             missing_slides.append(slide_num)
             logger.warning(f"Missing generated image for slide {slide_num}")
             continue
 
         # Add slide with image
-        slide = prs.slides.add_slide(blank_layout)
-        slide.shapes.add_picture(
-            str(generated_img),
-            Inches(0),
-            Inches(0),
-            width=prs.slide_width,
-            height=prs.slide_height,
-        )
+        slide = add_slide(blank_layout)
+        slide.shapes.add_picture(generated_img, origin, origin, width=width, height=height)
 
         # Add speaker notes if available
         if slide_num in speaker_notes:
@@ -1126,7 +1688,8 @@ def import_generated_images(prompt_dir: str, output_path: str):
         logger.error(error_msg)
         raise ValueError(error_msg)
 
-    prs.save(output_path)
+    with _pptx_media_stored():
+        prs.save(output_path)
     logger.info(f"PPTX saved: {output_path} ({imported_count} slides)")
 
     return missing_slides
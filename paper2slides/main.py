@@ -10,21 +10,8 @@ from pathlib import Path
 from dotenv import load_dotenv
 
 from paper2slides.utils import setup_logging
-from paper2slides.utils.path_utils import (
-    normalize_input_path,
-    get_project_name,
-    parse_style,
-)
-from paper2slides.core import (
-    get_base_dir,
-    get_config_dir,
-    detect_start_stage,
-    run_pipeline,
-    list_outputs,
-    STAGES,
-)
-
-os.environ.setdefault("CUDA_VISIBLE_DEVICES", "1")
+# Only what the parser needs; the pipeline and --list import the rest in main()
+from paper2slides.core.state import STAGES
 
 # Get project root directory (parent of paper2slides package)
 PROJECT_ROOT = Path(__file__).parent.parent
@@ -65,7 +52,9 @@ def main():
     parser.add_argument("--fast", action="store_true",
                         help="Fast mode: parse only, no RAG indexing (direct LLM query)")
     parser.add_argument("--parallel", type=int, nargs='?', const=2, default=None,
-                        help="Enable parallel slide generation with N workers (default: 2 if specified)")
+                        help="Enable parallel slide generation with N concurrent requests (default: 2 if specified)")
+    parser.add_argument("--image-batch-size", type=int, default=1,
+                        help="Slides per image generation request from the 3rd slide on (default: 1)")
     parser.add_argument("--export-prompts", action="store_true",
                         help="Export Nano Banana prompts instead of calling image generation API")
     parser.add_argument("--import-images", type=str, metavar="DIR",
@@ -74,6 +63,14 @@ def main():
                         help="Enhance speaker notes in checkpoint_plan.json with narrative style (e.g., outputs/.../checkpoint_plan.json)")
     parser.add_argument("--speaker-style", type=str, default="bruno",
                         help="Speaker notes style profile (default: bruno)")
+    parser.add_argument("--force-speaker-notes", action="store_true",
+                        help="Re-enhance all slides, even those whose narrative is already up to date")
+    parser.add_argument("--slides-per-request", type=int, default=1,
+                        help="Slides per narrative request when enhancing speaker notes (default: 1, try 5)")
+    parser.add_argument("--hedge-requests", action="store_true",
+                        help="Duplicate narrative requests that run well past the median latency (costs extra tokens)")
+    parser.add_argument("--batch-api", action="store_true",
+                        help="Enhance speaker notes via the OpenAI Batch API (50%% cheaper, up to 24h; decks of 50+ slides)")
     parser.add_argument("--pptx", action="store_true",
                         help="Generate PPTX output instead of PDF (default for prompt export mode)")
 
@@ -83,6 +80,7 @@ def main():
     setup_logging(level=logging.DEBUG if args.debug else logging.INFO)
     
     if args.list:
+        from paper2slides.core.pipeline import list_outputs
         list_outputs(args.output_dir)
         return
 
@@ -100,7 +98,14 @@ def main():
         logger.info(f"Enhancing speaker notes in: {checkpoint_path}")
         logger.info(f"Using style profile: {args.speaker_style}")
         try:
-            enhanced_count = enhance_speaker_notes(str(checkpoint_path), args.speaker_style)
+            enhanced_count = enhance_speaker_notes(
+                str(checkpoint_path),
+                args.speaker_style,
+                use_batch=args.batch_api,
+                force=args.force_speaker_notes,
+                slides_per_request=args.slides_per_request,
+                hedge=args.hedge_requests,
+            )
             logger.info(f"Successfully enhanced {enhanced_count} slides with narrative speaker notes")
             logger.info(f"Updated checkpoint: {checkpoint_path}")
         except Exception:
@@ -158,6 +163,9 @@ def main():
     if not args.input:
         parser.print_help()
         return
+
+    from paper2slides.utils.path_utils import normalize_input_path, get_project_name, parse_style
+    from paper2slides.core import get_base_dir, get_config_dir, detect_start_stage, run_pipeline
     
     # Normalize input path (convert to absolute path)
     try:
@@ -186,7 +194,8 @@ def main():
         "slides_length": args.length,
         "poster_density": args.density,
         "fast_mode": args.fast,
-        "max_workers": args.parallel if args.parallel else 1,
+        "max_concurrent": args.parallel if args.parallel else 1,
+        "batch_size": args.image_batch_size,
         "export_prompts": args.export_prompts,
         "use_pptx": args.pptx or args.export_prompts,  # Default to PPTX in prompt export mode
     }
@@ -210,6 +219,10 @@ def main():
     if from_stage != "rag":
         logger.info(f"Reusing existing checkpoints, starting from: {from_stage}")
     
+    # GPU pinning only matters for the pipeline (document parsing in the RAG
+    # stage); set it here so --list/--help and the standalone modes leave it alone
+    os.environ.setdefault("CUDA_VISIBLE_DEVICES", "1")
+
     # Run pipeline (CLI mode: no session_id or session_manager for cancellation)
     asyncio.run(run_pipeline(base_dir, config_dir, config, from_stage))
 
@@ -1831,8 +1831,7 @@ class DoclingParser(Parser):
                 image_dir = output_dir / "images"
                 image_dir.mkdir(parents=True, exist_ok=True)  # Ensure directory exists
                 image_path = image_dir / f"image_{num}.png"
-                with open(image_path, "wb") as f:
-                    f.write(base64.b64decode(base64_str))
+                image_path.write_bytes(base64.b64decode(base64_str))
                 return {
                     "type": "image",
                     "img_path": str(image_path.resolve()),  # Convert to absolute path
@@ -1,10 +1,16 @@
-from .file_utils import save_json, load_json, save_text
+from .file_utils import ensure_dir, decode_json, save_json, load_json, load_json_cached, save_text
 from .logging import setup_logging, log_section
+from .rate_limit import RateLimiter, retry
 
 __all__ = [
+    "ensure_dir",
+    "decode_json",
     "save_json",
     "load_json",
+    "load_json_cached",
     "save_text",
     "setup_logging",
     "log_section",
+    "RateLimiter",
+    "retry",
 ]
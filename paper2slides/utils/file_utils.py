@@ -1,29 +1,74 @@
 """
 File and JSON utilities
 """
+import functools
 import json
 from pathlib import Path
 from typing import Any, Optional
 
+import orjson
+
+_JSON_OPTIONS = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+
+
+def ensure_dir(path: Path):
+    """Create a directory (and parents) if it does not exist."""
+    path.mkdir(parents=True, exist_ok=True)
+
+
+def decode_json(raw: bytes) -> Any:
+    """
+    Decode JSON bytes with orjson, falling back to the stdlib decoder.
+
+    Checkpoints written before the switch to orjson may contain the NaN and
+    Infinity literals json.dump emits, which orjson rejects.
+    """
+    try:
+        return orjson.loads(raw)
+    except orjson.JSONDecodeError:
+        return json.loads(raw)
+
 
 def save_json(path: Path, data: Any):
-    """Save data to JSON file."""
-    path.parent.mkdir(parents=True, exist_ok=True)
-    with open(path, "w", encoding="utf-8") as f:
-        json.dump(data, f, ensure_ascii=False, indent=2, default=str)
+    """Save data to JSON file (atomically: write a temp file, then rename)."""
+    ensure_dir(path.parent)
+    tmp_path = path.with_suffix(path.suffix + ".tmp")
+    tmp_path.write_bytes(orjson.dumps(data, default=str, option=_JSON_OPTIONS))
+    tmp_path.replace(path)
 
 
 def load_json(path: Path) -> Optional[Any]:
     """Load data from JSON file."""
     if path.exists():
-        with open(path, "r", encoding="utf-8") as f:
-            return json.load(f)
+        return decode_json(path.read_bytes())
     return None
 
 
+def load_json_cached(path: Path) -> Optional[Any]:
+    """
+    Load data from JSON file, memoized on (path, mtime, size).
+
+    Repeated loads of an unchanged checkpoint within one process skip the
+    read and decode. The returned object is shared between callers: treat it
+    as read-only (use load_json when the data will be modified and saved).
+    """
+    path = Path(path)
+    try:
+        stat = path.stat()
+    except FileNotFoundError:
+        return None
+    return _load_json_at(path.resolve(), stat.st_mtime_ns, stat.st_size)
+
+
+@functools.lru_cache(maxsize=16)
+def _load_json_at(path: Path, mtime_ns: int, size: int) -> Optional[Any]:
+    # mtime_ns and size only key the cache: a rewritten file misses it
+    return decode_json(path.read_bytes())
+
+
 def save_text(path: Path, text: str):
     """Save text to file."""
-    path.parent.mkdir(parents=True, exist_ok=True)
+    ensure_dir(path.parent)
     with open(path, "w", encoding="utf-8") as f:
         f.write(text)
 
@@ -0,0 +1,206 @@
+"""
+Request/token rate limiting and retry backoff shared by the LLM and image generation clients
+"""
+import asyncio
+import contextlib
+import functools
+import logging
+import random
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import AsyncIterator, Optional, Tuple, Type
+
+# HTTP statuses that fail the same way on every attempt (bad request, auth)
+NON_RETRYABLE_STATUS = frozenset({400, 401, 403})
+
+
+class RateLimiter:
+    """
+    Proactive throttle for LLM requests.
+
+    Tracks two leaky buckets, requests/min and tokens/min, refilled by elapsed
+    wall time. A request is only released once both buckets have capacity, so
+    concurrent slides wait locally instead of burning time in 429 retries.
+    A limit of None disables that bucket.
+    """
+
+    def __init__(
+        self,
+        max_requests_per_minute: Optional[float] = None,
+        max_tokens_per_minute: Optional[float] = None,
+        available_request_capacity: Optional[float] = None,
+        available_token_capacity: Optional[float] = None,
+    ):
+        self.max_requests_per_minute = max_requests_per_minute
+        self.max_tokens_per_minute = max_tokens_per_minute
+        self.available_request_capacity = (
+            available_request_capacity if available_request_capacity is not None
+            else max_requests_per_minute
+        )
+        self.available_token_capacity = (
+            available_token_capacity if available_token_capacity is not None
+            else max_tokens_per_minute
+        )
+        self._last_update = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    def _refill(self):
+        now = time.monotonic()
+        elapsed = now - self._last_update
+        self._last_update = now
+        if self.max_requests_per_minute is not None:
+            self.available_request_capacity = min(
+                self.max_requests_per_minute,
+                self.available_request_capacity + self.max_requests_per_minute * elapsed / 60.0,
+            )
+        if self.max_tokens_per_minute is not None:
+            self.available_token_capacity = min(
+                self.max_tokens_per_minute,
+                self.available_token_capacity + self.max_tokens_per_minute * elapsed / 60.0,
+            )
+
+    def _seconds_until_available(self, est_tokens: int) -> float:
+        wait = 0.0
+        if self.max_requests_per_minute is not None and self.available_request_capacity < 1:
+            deficit = 1 - self.available_request_capacity
+            wait = max(wait, deficit * 60.0 / self.max_requests_per_minute)
+        if self.max_tokens_per_minute is not None and self.available_token_capacity < est_tokens:
+            deficit = est_tokens - self.available_token_capacity
+            wait = max(wait, deficit * 60.0 / self.max_tokens_per_minute)
+        return wait
+
+    @contextlib.asynccontextmanager
+    async def acquire(self, est_tokens: int = 0) -> AsyncIterator[None]:
+        """
+        Wait until both buckets can cover one request of est_tokens tokens.
+
+        Args:
+            est_tokens: Estimated prompt + completion tokens for the request
+        """
+        if self.max_tokens_per_minute is not None:
+            # A request larger than the whole budget would otherwise wait forever
+            est_tokens = min(est_tokens, int(self.max_tokens_per_minute))
+
+        async with self._lock:
+            while True:
+                self._refill()
+                wait = self._seconds_until_available(est_tokens)
+                if wait <= 0:
+                    break
+                await asyncio.sleep(wait)
+
+            if self.max_requests_per_minute is not None:
+                self.available_request_capacity -= 1
+            if self.max_tokens_per_minute is not None:
+                self.available_token_capacity -= est_tokens
+        yield
+
+
+def retry_after_seconds(error: BaseException) -> Optional[float]:
+    """Delay requested by an API error's Retry-After(-Ms) header, or None."""
+    headers = getattr(getattr(error, "response", None), "headers", None)
+    if not headers:
+        return None
+    try:
+        if headers.get("retry-after-ms"):
+            return float(headers["retry-after-ms"]) / 1000.0
+        value = headers.get("retry-after")
+        if not value:
+            return None
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            # HTTP-date form
+            return max(0.0, (parsedate_to_datetime(value) - datetime.now(timezone.utc)).total_seconds())
+    except (TypeError, ValueError):
+        return None
+
+
+class Backoff:
+    """
+    Decorrelated-jitter backoff: each delay is uniform(base, 3 * previous), capped.
+
+    Unlike plain exponential backoff, concurrent callers that failed together
+    spread out instead of retrying in lockstep. Use one instance per call so
+    the delay starts over after a success.
+    """
+
+    def __init__(self, base_delay: float, max_delay: float):
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self._previous = base_delay
+
+    def next_delay(self) -> float:
+        self._previous = min(self.max_delay, random.uniform(self.base_delay, self._previous * 3))
+        return self._previous
+
+
+def retry(
+    max_attempts: int,
+    transient_errors: Tuple[Type[BaseException], ...] = (),
+    transient_max_attempts: Optional[int] = None,
+    base_delay: float = 1.0,
+    max_delay: float = 60.0,
+):
+    """
+    Retry a sync or async function with decorrelated-jitter backoff.
+
+    Any exception is retried until max_attempts calls have been made,
+    transient_errors (rate limits, timeouts, ...) until transient_max_attempts.
+    A Retry-After header on the error replaces the computed delay (still capped
+    at max_delay), and errors with a 400/401/403 status are raised at once.
+    """
+    transient_max_attempts = transient_max_attempts or max_attempts
+
+    def next_delay(error: BaseException, attempt: int, backoff: Backoff) -> Optional[float]:
+        """Seconds to wait before the next attempt, or None to give up."""
+        if getattr(error, "status_code", None) in NON_RETRYABLE_STATUS:
+            return None
+        limit = transient_max_attempts if isinstance(error, transient_errors) else max_attempts
+        if attempt >= limit:
+            return None
+        delay = backoff.next_delay()
+        requested = retry_after_seconds(error)
+        return min(max_delay, requested) if requested is not None else delay
+
+    def decorator(fn):
+        logger = logging.getLogger(fn.__module__)
+
+        def log_retry(error: BaseException, attempt: int, delay: float):
+            logger.warning(f"{fn.__name__} failed (attempt {attempt}): {error}; retrying in {delay:.1f}s")
+
+        if asyncio.iscoroutinefunction(fn):
+            @functools.wraps(fn)
+            async def async_wrapper(*args, **kwargs):
+                backoff = Backoff(base_delay, max_delay)
+                attempt = 1
+                while True:
+                    try:
+                        return await fn(*args, **kwargs)
+                    except Exception as e:
+                        delay = next_delay(e, attempt, backoff)
+                        if delay is None:
+                            raise
+                        log_retry(e, attempt, delay)
+                    await asyncio.sleep(delay)
+                    attempt += 1
+            return async_wrapper
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            backoff = Backoff(base_delay, max_delay)
+            attempt = 1
+            while True:
+                try:
+                    return fn(*args, **kwargs)
+                except Exception as e:
+                    delay = next_delay(e, attempt, backoff)
+                    if delay is None:
+                        raise
+                    log_retry(e, attempt, delay)
+                time.sleep(delay)
+                attempt += 1
+        return wrapper
+
+    return decorator